@@ -171,9 +171,7 @@ def _run_cli(args: argparse.Namespace) -> None:
     ))
 
     # Spawn initial goblins (tiered)
-    for i in range(1, config.initial_entity_count):
-        entity = generator.spawn(world)
-        world.add_entity(entity)
+    generator.spawn_many(world, config.initial_entity_count - 1)
 
     # Spawn camp guards
     for camp_pos in camp_positions:
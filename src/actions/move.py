@@ -11,7 +11,7 @@ import logging
 from typing import TYPE_CHECKING
 
 from src.actions.base import ActionProposal
-from src.core.enums import ActionType
+from src.core.enums import ActionType, Material
 from src.core.models import Vector2
 
 if TYPE_CHECKING:
@@ -53,7 +53,7 @@ class MoveAction:
             from src.core.attributes import speed_delay
             spd = entity.effective_spd()
             # Road tiles grant a speed bonus
-            if world.grid.is_road(target) or world.grid.is_bridge(target):
+            if world.grid.get(target) in (Material.ROAD, Material.BRIDGE):
                 spd = max(spd, int(spd * 1.3))
             delay = speed_delay(spd, "move", entity.stats.interaction_speed)
             # Engagement Lock: fleeing from adjacent hostiles costs double delay
@@ -84,8 +84,9 @@ class AIBrain:
 
         # Update memory: remember visible hostile entities
         visible = Perception.visible_entities(actor, snapshot, actor.stats.vision_range)
+        hostile = self._faction_reg.hostile_mask(actor.faction)
         for e in visible:
-            if self._faction_reg.is_hostile(actor.faction, e.faction):
+            if hostile[e.faction]:
                 actor.memory[e.id] = e.pos
 
         return new_state, proposal
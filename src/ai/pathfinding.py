@@ -50,7 +50,7 @@ TERRAIN_MOVE_COST: dict[Material, float] = {
 }
 
 # Cardinal directions (no diagonals — Manhattan grid)
-_DIRS = (Vector2(1, 0), Vector2(-1, 0), Vector2(0, 1), Vector2(0, -1))
+_DIR_XY = ((1, 0), (-1, 0), (0, 1), (0, -1))
 
 
 def tile_cost(grid: Grid, pos: Vector2) -> float:
@@ -112,6 +112,9 @@ class Pathfinder:
         nodes_explored = 0
 
         gx, gy = goal.x, goal.y
+        is_walkable_xy = grid.is_walkable_xy
+        get_xy = grid.get_xy
+        move_cost = TERRAIN_MOVE_COST.get
 
         while open_heap and nodes_explored < self._max_nodes:
             _, _, cx, cy = heapq.heappop(open_heap)
@@ -128,22 +131,22 @@ class Pathfinder:
 
             current_g = g_score[ckey]
 
-            for d in _DIRS:
-                nx, ny = cx + d.x, cy + d.y
+            for dx, dy in _DIR_XY:
+                nx, ny = cx + dx, cy + dy
                 nkey = (nx, ny)
 
                 if nkey in closed:
                     continue
 
-                npos = Vector2(nx, ny)
-                if not grid.is_walkable(npos):
+                # Raw-coordinate grid access: no Vector2 per neighbor
+                if not is_walkable_xy(nx, ny):
                     continue
 
                 # Occupied check (skip goal tile)
                 if nkey in occ and not (exclude_goal_from_occupied and nx == gx and ny == gy):
                     continue
 
-                step_cost = tile_cost(grid, npos)
+                step_cost = move_cost(get_xy(nx, ny), 1.0)
                 tentative_g = current_g + step_cost
 
                 if tentative_g < g_score.get(nkey, float("inf")):
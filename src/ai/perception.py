@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from src.core.enums import Material
 from src.core.faction import FactionRegistry
 from src.core.models import Entity, Vector2
 
@@ -60,10 +61,8 @@ class Perception:
         Uses the FactionRegistry when provided; falls back to faction != actor.faction.
         """
         if faction_reg is not None:
-            enemies = [
-                e for e in visible
-                if e.alive and faction_reg.is_hostile(actor.faction, e.faction)
-            ]
+            hostile = faction_reg.hostile_mask(actor.faction)
+            enemies = [e for e in visible if e.alive and hostile[e.faction]]
         else:
             enemies = [e for e in visible if e.alive and e.faction != actor.faction]
         if not enemies:
@@ -82,10 +81,8 @@ class Perception:
         Tie-broken by distance then lowest ID.
         """
         if faction_reg is not None:
-            enemies = [
-                e for e in visible
-                if e.alive and faction_reg.is_hostile(actor.faction, e.faction)
-            ]
+            hostile = faction_reg.hostile_mask(actor.faction)
+            enemies = [e for e in visible if e.alive and hostile[e.faction]]
         else:
             enemies = [e for e in visible if e.alive and e.faction != actor.faction]
         if not enemies:
@@ -108,9 +105,10 @@ class Perception:
     ) -> Entity | None:
         """Return the closest visible allied entity, tie-broken by lowest ID."""
         if faction_reg is not None:
+            allied = faction_reg.allied_mask(actor.faction)
             allies = [
                 e for e in visible
-                if e.alive and e.id != actor.id and faction_reg.is_allied(actor.faction, e.faction)
+                if e.alive and e.id != actor.id and allied[e.faction]
             ]
         else:
             allies = [
@@ -129,9 +127,10 @@ class Perception:
     ) -> int:
         """Count visible allies (same faction, excluding self)."""
         if faction_reg is not None:
+            allied = faction_reg.allied_mask(actor.faction)
             return sum(
                 1 for e in visible
-                if e.alive and e.id != actor.id and faction_reg.is_allied(actor.faction, e.faction)
+                if e.alive and e.id != actor.id and allied[e.faction]
             )
         return sum(
             1 for e in visible
@@ -169,17 +168,17 @@ class Perception:
     @staticmethod
     def is_in_town(actor: Entity, snapshot: Snapshot) -> bool:
         """Return True if the actor is standing on a TOWN tile."""
-        return snapshot.grid.is_town(actor.pos)
+        return snapshot.grid.is_tile(actor.pos, Material.TOWN)
 
     @staticmethod
     def is_in_sanctuary(actor: Entity, snapshot: Snapshot) -> bool:
         """Return True if the actor is standing on a SANCTUARY tile."""
-        return snapshot.grid.is_sanctuary(actor.pos)
+        return snapshot.grid.is_tile(actor.pos, Material.SANCTUARY)
 
     @staticmethod
     def is_in_camp(actor: Entity, snapshot: Snapshot) -> bool:
         """Return True if the actor is standing on a CAMP tile."""
-        return snapshot.grid.is_camp(actor.pos)
+        return snapshot.grid.is_tile(actor.pos, Material.CAMP)
 
     @staticmethod
     def is_on_home_territory(
@@ -259,10 +258,9 @@ class Perception:
                 )
                 if not is_frontier:
                     continue
-                candidate = Vector2(tx, ty)
-                if grid.is_walkable(candidate):
+                if grid.is_walkable_xy(tx, ty):
                     dist = abs(dx) + abs(dy)
-                    frontier.append((dist, candidate))
+                    frontier.append((dist, Vector2(tx, ty)))
                     if len(frontier) >= 32:
                         break
             if len(frontier) >= 32:
@@ -39,9 +39,9 @@ from src.core.buildings import (
     Building, RECIPES, RECIPE_MAP, SHOP_INVENTORY,
     can_craft, item_sell_price, shop_buy_price,
 )
-from src.core.enums import AIState, ActionType, Domain, EntityRole
+from src.core.enums import AIState, ActionType, Domain, EntityRole, Material
 from src.core.faction import Faction, FactionRegistry
-from src.core.items import ITEM_REGISTRY, ItemType
+from src.core.items import EQUIPPABLE_TYPES, ITEM_REGISTRY, ItemType
 from src.core.models import DIRECTION_OFFSETS, Entity, Vector2
 
 if TYPE_CHECKING:
@@ -243,7 +243,7 @@ def is_in_hostile_town(ctx: AIContext) -> bool:
     """Non-hero entity standing on a TOWN tile (takes aura damage)."""
     return (
         ctx.actor.faction != Faction.HERO_GUILD
-        and ctx.snapshot.grid.is_town(ctx.actor.pos)
+        and ctx.snapshot.grid.is_tile(ctx.actor.pos, Material.TOWN)
     )
 
 
@@ -288,7 +288,7 @@ def hero_has_sellable_items(actor: Entity) -> bool:
         if t.gold_value > 0:
             return True
         # Sell equipment that's worse than what's equipped
-        if t.item_type in (ItemType.WEAPON, ItemType.ARMOR, ItemType.ACCESSORY):
+        if t.item_type in EQUIPPABLE_TYPES:
             equipped = _get_equipped_for_type(actor, t.item_type)
             if equipped:
                 eq_t = ITEM_REGISTRY.get(equipped)
@@ -352,7 +352,7 @@ def hero_wants_to_buy(actor: Entity) -> str | None:
         t = ITEM_REGISTRY.get(iid)
         if t is None:
             continue
-        if t.item_type not in (ItemType.WEAPON, ItemType.ARMOR, ItemType.ACCESSORY):
+        if t.item_type not in EQUIPPABLE_TYPES:
             continue
         equipped = _get_equipped_for_type(actor, t.item_type)
         new_power = _item_power(t)
@@ -381,7 +381,7 @@ def hero_wants_to_buy(actor: Entity) -> str | None:
         recipe = RECIPE_MAP.get(actor.craft_target)
         if recipe:
             for mat_id, needed in recipe.materials.items():
-                have = inv.items.count(mat_id)
+                have = inv.count_item(mat_id)
                 if have < needed:
                     price = shop_buy_price(mat_id)
                     if price and gold >= price and inv.can_add(mat_id):
@@ -452,7 +452,7 @@ def best_ready_skill(actor: Entity, dist_to_enemy: int = 1, nearby_enemies: int
             skill_range = getattr(sdef, 'range', 1) or 1
             if skill_range < dist_to_enemy:
                 continue
-        cost = si.effective_stamina_cost(sdef.stamina_cost)
+        cost = si.costs(sdef)[0]
         if actor.stats.stamina < cost:
             continue
         power = si.effective_power(sdef.power)
@@ -718,8 +718,9 @@ class CombatHandler(StateHandler):
         # Can we attack from here? (within weapon range)
         if dist <= weapon_rng:
             # Count nearby enemies for AoE skill preference
+            hostile = ctx.faction_reg.hostile_mask(actor.faction)
             nearby_count = sum(
-                1 for v in ctx.visible if ctx.faction_reg.is_hostile(actor.faction, v.faction)
+                1 for v in ctx.visible if hostile[v.faction]
                 and v.alive and actor.pos.manhattan(v.pos) <= max(weapon_rng, 4)
             )
             # Try to use a skill first (pass distance + nearby count for AoE awareness)
@@ -1034,11 +1035,11 @@ class VisitShopHandler(StateHandler):
                     recipe = RECIPE_MAP.get(actor.craft_target)
                     if recipe and iid in recipe.materials:
                         needed = recipe.materials[iid]
-                        have = inv.items.count(iid) - len([x for x in items_to_sell if x == iid])
+                        have = inv.count_item(iid) - len([x for x in items_to_sell if x == iid])
                         if have <= needed:
                             continue
                 should_sell = True
-            elif t.item_type in (ItemType.WEAPON, ItemType.ARMOR, ItemType.ACCESSORY):
+            elif t.item_type in EQUIPPABLE_TYPES:
                 equipped = _get_equipped_for_type(actor, t.item_type)
                 if equipped:
                     eq_t = ITEM_REGISTRY.get(equipped)
@@ -1140,7 +1141,7 @@ class VisitBlacksmithHandler(StateHandler):
                 if inv.can_add(recipe.output_item):
                     inv.add_item(recipe.output_item)
                     t = ITEM_REGISTRY.get(recipe.output_item)
-                    if t and t.item_type in (ItemType.WEAPON, ItemType.ARMOR, ItemType.ACCESSORY):
+                    if t and t.item_type in EQUIPPABLE_TYPES:
                         inv.equip(recipe.output_item)
                 actor.craft_target = None
                 return AIState.VISIT_BLACKSMITH, ActionProposal(
@@ -1153,7 +1154,7 @@ class VisitBlacksmithHandler(StateHandler):
             if recipe:
                 missing = []
                 for mat_id, qty in recipe.materials.items():
-                    have = inv.items.count(mat_id)
+                    have = inv.count_item(mat_id)
                     if have < qty:
                         missing.append(f"{mat_id} ({have}/{qty})")
                 gold_needed = max(0, recipe.gold_cost - actor.stats.gold)
@@ -1346,14 +1347,14 @@ class VisitClassHallHandler(StateHandler):
                 actor_id=actor.id, verb=ActionType.REST, reason="No class → leaving")
 
         # Phase 1: Learn new class skills (with mastery requirements)
-        known_ids = {s.skill_id for s in actor.skills}
+        known = {s.skill_id: s for s in actor.skills}
         available = available_class_skills(hero_class, actor.stats.level)
         for sid in available:
-            if sid not in known_ids:
+            if sid not in known:
                 sdef = SKILL_DEFS.get(sid)
                 if sdef and actor.stats.gold >= sdef.gold_cost:
                     can_learn, reason = can_learn_skill(
-                        sdef, actor.stats.level, actor.skills, actor.class_mastery)
+                        sdef, actor.stats.level, known, actor.class_mastery)
                     if not can_learn:
                         continue
                     actor.stats.gold -= sdef.gold_cost
@@ -1499,12 +1500,12 @@ class VisitHomeHandler(StateHandler):
                     recipe = RECIPE_MAP.get(actor.craft_target)
                     if recipe and iid in recipe.materials:
                         needed = recipe.materials[iid]
-                        have = inv.items.count(iid) - len([x for x in stored if x == iid])
+                        have = inv.count_item(iid) - len([x for x in stored if x == iid])
                         if have <= needed:
                             continue
                 should_store = True
             # Store equipment weaker than what's equipped
-            elif t.item_type in (ItemType.WEAPON, ItemType.ARMOR, ItemType.ACCESSORY):
+            elif t.item_type in EQUIPPABLE_TYPES:
                 equipped = _get_equipped_for_type(actor, t.item_type)
                 if equipped:
                     eq_t = ITEM_REGISTRY.get(equipped)
@@ -1512,7 +1513,7 @@ class VisitHomeHandler(StateHandler):
                         should_store = True
             # Store excess consumables (keep 2 of each)
             elif t.item_type == ItemType.CONSUMABLE and t.heal_amount > 0:
-                count_in_inv = inv.items.count(iid) - len([x for x in stored if x == iid])
+                count_in_inv = inv.count_item(iid) - len([x for x in stored if x == iid])
                 if count_in_inv > 2:
                     should_store = True
 
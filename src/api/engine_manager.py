@@ -520,10 +520,8 @@ class EngineManager:
         logger.info("Placed hero house at %s for hero #%d", hero_house_pos, hero_eid)
 
         # --- Spawn initial goblins (wanderers, not tied to a region) ---
-        for i in range(1, cfg.initial_entity_count):
-            entity = generator.spawn(world)
-            world.add_entity(entity)
-            self._total_spawned += 1
+        spawned = generator.spawn_many(world, cfg.initial_entity_count - 1)
+        self._total_spawned += len(spawned)
 
         # --- Spawn entities + resources at region locations (epic-15) ---
         for region in world.regions:
@@ -629,7 +627,8 @@ class EngineManager:
                      len(world.resource_nodes), len(world.regions),
                      sum(len(r.locations) for r in world.regions))
 
-        faction_reg = FactionRegistry.default()
+        # Each build gets its own registry so nothing leaks between worlds
+        faction_reg = FactionRegistry.fresh_default()
         brain = AIBrain(cfg, self._rng, faction_reg)
         self._worker_pool = WorkerPool(cfg, brain)
         conflict_resolver = ConflictResolver(cfg, self._rng)
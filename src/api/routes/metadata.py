@@ -423,7 +423,7 @@ def get_classes() -> ClassesResponse:
             attr_bonuses=_attr_bonuses(cd),
             cap_bonuses=_cap_bonuses(cd),
             scaling=_scaling(cd),
-            skill_ids=CLASS_SKILLS.get(hc, []),
+            skill_ids=list(CLASS_SKILLS.get(hc, ())),
             breakthrough=bt_view,
         ))
 
@@ -186,7 +186,7 @@ def _serialize_full_entity(e, manager: EngineManager) -> EntitySchema:
                 hp_per_tick=eff.hp_per_tick,
             )
             for eff in e.effects
-            if not eff.expired
+            if eff.remaining_ticks != 0
         ],
         base_atk=e.stats.atk,
         base_def=e.stats.def_,
@@ -15,8 +15,14 @@ Skill types:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import sys
+from bisect import bisect_right
+from dataclasses import dataclass
+from collections.abc import Mapping
 from enum import IntEnum, unique
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
 from typing import Annotated
 
 from pydantic import PlainSerializer
@@ -113,13 +119,35 @@ class SkillDef:
     damage_type: _DamageTypeSer = DamageType.PHYSICAL
 
 
-@dataclass(slots=True)
+# Mastery tier thresholds and tier-indexed multipliers (index = mastery_tier)
+_TIER_THRESHOLDS = (25.0, 50.0, 75.0, 100.0)
+_POWER_MULT = (1.0, 1.0, 1.0 + 0.20, 1.0 + 0.20, 1.0 + 0.20 + 0.15)
+_STAM_PCT = (100, 90, 90, 80, 80)   # integer percent; matches max(1, int(cost * 0.9)) / int(cost * 0.8) exactly
+_CD_DELTA = (0, 0, 0, 1, 1)
+
+
+@dataclass(slots=True, init=False, eq=False, repr=False)
 class SkillInstance:
-    """A learned skill on an entity, tracking cooldown and mastery."""
+    """A learned skill on an entity, tracking cooldown and mastery.
+
+    Compared by identity; __init__ is hand-written to write slots directly.
+    """
     skill_id: str
-    cooldown_remaining: int = 0
-    mastery: float = 0.0       # 0.0 to 100.0
-    times_used: int = 0
+    cooldown_remaining: int
+    mastery: float             # 0.0 to 100.0
+    times_used: int
+
+    def __init__(
+        self,
+        skill_id: str,
+        cooldown_remaining: int = 0,
+        mastery: float = 0.0,
+        times_used: int = 0,
+    ) -> None:
+        self.skill_id = skill_id
+        self.cooldown_remaining = cooldown_remaining
+        self.mastery = mastery
+        self.times_used = times_used
 
     def is_ready(self) -> bool:
         return self.cooldown_remaining <= 0
@@ -128,8 +156,23 @@ class SkillInstance:
         self.cooldown_remaining = base_cooldown
         self.times_used += 1
         # Mastery gain: diminishing returns
-        gain = max(0.1, 1.0 - self.mastery * 0.008)
-        self.mastery = min(100.0, self.mastery + gain)
+        m = self.mastery
+        if m >= 100.0:
+            self.mastery = 100.0
+        else:
+            self.mastery = min(100.0, m + max(0.1, 1.0 - m * 0.008))
+
+    def costs(self, sdef: SkillDef) -> tuple[int, int]:
+        """(effective stamina cost, effective cooldown) for *sdef* at this mastery.
+
+        Registered skills read the precomputed SKILL_COSTS row for the tier.
+        """
+        tier = bisect_right(_TIER_THRESHOLDS, self.mastery)
+        sid = sdef.skill_id
+        if SKILL_DEFS.get(sid) is sdef:
+            return SKILL_COSTS[sid][tier]
+        return (self.effective_stamina_cost(sdef.stamina_cost),
+                self.effective_cooldown(sdef.cooldown))
 
     def tick(self) -> None:
         if self.cooldown_remaining > 0:
@@ -138,47 +181,34 @@ class SkillInstance:
     @property
     def mastery_tier(self) -> int:
         """0=novice, 1=apprentice(25), 2=adept(50), 3=expert(75), 4=master(100)"""
-        if self.mastery >= 100.0:
-            return 4
-        if self.mastery >= 75.0:
-            return 3
-        if self.mastery >= 50.0:
-            return 2
-        if self.mastery >= 25.0:
-            return 1
-        return 0
+        return bisect_right(_TIER_THRESHOLDS, self.mastery)
 
     def effective_power(self, base_power: float) -> float:
-        """Power modified by mastery. +20% at mastery tier 2+."""
-        mult = 1.0
-        if self.mastery >= 50.0:
-            mult += 0.20
-        if self.mastery >= 100.0:
-            mult += 0.15  # Total +35% at master
-        return base_power * mult
+        """Power modified by mastery. +20% at tier 2+, +35% at master."""
+        return base_power * _POWER_MULT[self.mastery_tier]
 
     def effective_stamina_cost(self, base_cost: int) -> int:
         """Stamina cost reduced by mastery. -10% at tier 1+, -20% at tier 3+."""
-        mult = 1.0
-        if self.mastery >= 25.0:
-            mult -= 0.10
-        if self.mastery >= 75.0:
-            mult -= 0.10  # Total -20%
-        return max(1, int(base_cost * mult))
+        cost = base_cost * _STAM_PCT[self.mastery_tier] // 100
+        return cost if cost >= 1 else 1
 
     def effective_cooldown(self, base_cd: int) -> int:
         """Cooldown reduced at mastery tier 3+."""
-        if self.mastery >= 75.0:
-            return max(1, base_cd - 1)
+        delta = _CD_DELTA[self.mastery_tier]
+        if delta:
+            return max(1, base_cd - delta)
         return base_cd
 
-    def copy(self) -> SkillInstance:
-        return SkillInstance(
-            skill_id=self.skill_id,
-            cooldown_remaining=self.cooldown_remaining,
-            mastery=self.mastery,
-            times_used=self.times_used,
-        )
+    def __copy__(self) -> SkillInstance:
+        # Bypass __init__ and write slots directly
+        new = SkillInstance.__new__(SkillInstance)
+        new.skill_id = self.skill_id
+        new.cooldown_remaining = self.cooldown_remaining
+        new.mastery = self.mastery
+        new.times_used = self.times_used
+        return new
+
+    copy = __copy__
 
 
 # ---------------------------------------------------------------------------
@@ -280,7 +310,8 @@ class BreakthroughDef:
 
 # -- Class Definitions --
 
-CLASS_DEFS: dict[HeroClass, ClassDef] = {
+# Registries below are read-only views; nothing mutates them after import.
+CLASS_DEFS: Mapping[HeroClass, ClassDef] = MappingProxyType({
     # ---- Tier 1 — Base Classes ----
     HeroClass.WARRIOR: ClassDef(
         class_id=HeroClass.WARRIOR, name="Warrior",
@@ -525,7 +556,29 @@ CLASS_DEFS: dict[HeroClass, ClassDef] = {
         str_scaling='B', agi_scaling='B', vit_scaling='C', int_scaling='E', spi_scaling='E', wis_scaling='E', end_scaling='B', per_scaling='B', cha_scaling='E',
         tier=1, role='Melee DPS / Flanker',
     ),
-}
+})
+
+# Dense tables indexed directly by class id (0..max HeroClass); None where
+# the id has no ClassDef. HeroClass ids are small ints, so a tuple index
+# replaces a dict probe on the spawn path.
+_CLASS_ID_COUNT = max(HeroClass) + 1
+CLASS_DEFS_BY_ID: tuple[ClassDef | None, ...] = tuple(
+    CLASS_DEFS.get(i) for i in range(_CLASS_ID_COUNT)
+)
+
+# Class id → attribute bonuses / cap bonuses as 9-tuples in Attributes field
+# order (str, agi, vit, int, spi, wis, end, per, cha), for spawn-time math.
+CLASS_BONUSES: tuple[tuple[int, ...] | None, ...] = tuple(
+    (d.str_bonus, d.agi_bonus, d.vit_bonus, d.int_bonus, d.spi_bonus,
+     d.wis_bonus, d.end_bonus, d.per_bonus, d.cha_bonus) if d is not None else None
+    for d in CLASS_DEFS_BY_ID
+)
+CLASS_CAP_BONUSES: tuple[tuple[int, ...] | None, ...] = tuple(
+    (d.str_cap_bonus, d.agi_cap_bonus, d.vit_cap_bonus, d.int_cap_bonus,
+     d.spi_cap_bonus, d.wis_cap_bonus, d.end_cap_bonus, d.per_cap_bonus,
+     d.cha_cap_bonus) if d is not None else None
+    for d in CLASS_DEFS_BY_ID
+)
 
 # -- Breakthrough Definitions --
 
@@ -557,233 +610,287 @@ BREAKTHROUGHS: dict[HeroClass, BreakthroughDef] = {
 }
 
 
+# Int-keyed mirror of BREAKTHROUGHS for hot lookups (public dict stays enum-keyed)
+_BREAKTHROUGHS_BY_ID: dict[int, BreakthroughDef] = {int(k): v for k, v in BREAKTHROUGHS.items()}
+
+
 # -- Skill Definitions --
 
-SKILL_DEFS: dict[str, SkillDef] = {}
-
-
-def _reg_skill(s: SkillDef) -> None:
-    SKILL_DEFS[s.skill_id] = s
-
-
-# ---- Warrior class skills ----
-_reg_skill(SkillDef(
-    "power_strike", "Power Strike",
-    "A devastating blow dealing 1.8x damage.",
-    SkillType.ACTIVE, SkillTarget.SINGLE_ENEMY, HeroClass.WARRIOR,
-    level_req=1, gold_cost=50, cooldown=4, stamina_cost=12,
-    power=1.8, range=1,
-))
-_reg_skill(SkillDef(
-    "shield_wall", "Shield Wall",
-    "Brace for impact, boosting DEF by 50% for 3 ticks.",
-    SkillType.ACTIVE, SkillTarget.SELF, HeroClass.WARRIOR,
-    level_req=3, gold_cost=100, cooldown=8, stamina_cost=15,
-    mastery_req="power_strike", mastery_threshold=25.0,
-    def_mod=0.5, duration=3,
-))
-_reg_skill(SkillDef(
-    "whirlwind", "Whirlwind",
-    "Spin with weapon extended, dealing 1.5x damage to all enemies within radius 1.",
-    SkillType.ACTIVE, SkillTarget.AREA_ENEMIES, HeroClass.WARRIOR,
-    level_req=5, gold_cost=200, cooldown=8, stamina_cost=20,
-    mastery_req="shield_wall", mastery_threshold=25.0,
-    power=1.5, range=1, radius=1, aoe_falloff=0.0,
-))
-
-# ---- Ranger class skills ----
-_reg_skill(SkillDef(
-    "quick_shot", "Quick Shot",
-    "A fast ranged attack dealing 1.5x damage from up to 3 tiles away.",
-    SkillType.ACTIVE, SkillTarget.SINGLE_ENEMY, HeroClass.RANGER,
-    level_req=1, gold_cost=50, cooldown=3, stamina_cost=8,
-    power=1.5, range=3,
-))
-_reg_skill(SkillDef(
-    "evasive_step", "Evasive Step",
-    "Boost evasion by 30% for 3 ticks.",
-    SkillType.ACTIVE, SkillTarget.SELF, HeroClass.RANGER,
-    level_req=3, gold_cost=100, cooldown=7, stamina_cost=10,
-    mastery_req="quick_shot", mastery_threshold=25.0,
-    evasion_mod=0.30, duration=3,
-))
-_reg_skill(SkillDef(
-    "rain_of_arrows", "Rain of Arrows",
-    "Launch a volley of arrows into an area, dealing 1.4x damage in radius 2.",
-    SkillType.ACTIVE, SkillTarget.AREA_ENEMIES, HeroClass.RANGER,
-    level_req=5, gold_cost=200, cooldown=10, stamina_cost=18,
-    mastery_req="evasive_step", mastery_threshold=25.0,
-    power=1.4, range=4, radius=2, aoe_falloff=0.15,
-))
-
-# ---- Mage class skills ----
-_reg_skill(SkillDef(
-    "arcane_bolt", "Arcane Bolt",
-    "Launch a magical bolt dealing 2.0x damage at range 4.",
-    SkillType.ACTIVE, SkillTarget.SINGLE_ENEMY, HeroClass.MAGE,
-    level_req=1, gold_cost=50, cooldown=4, stamina_cost=14,
-    power=2.0, range=4, damage_type=DamageType.MAGICAL,
-))
-_reg_skill(SkillDef(
-    "frost_shield", "Frost Shield",
-    "Create an ice barrier boosting DEF by 40% and slowing attackers for 3 ticks.",
-    SkillType.ACTIVE, SkillTarget.SELF, HeroClass.MAGE,
-    level_req=3, gold_cost=100, cooldown=8, stamina_cost=16,
-    mastery_req="arcane_bolt", mastery_threshold=25.0,
-    def_mod=0.4, duration=3,
-))
-_reg_skill(SkillDef(
-    "fireball", "Fireball",
-    "Hurl a ball of fire that explodes on impact, dealing 1.8x magical damage in radius 2.",
-    SkillType.ACTIVE, SkillTarget.AREA_ENEMIES, HeroClass.MAGE,
-    level_req=5, gold_cost=200, cooldown=8, stamina_cost=22,
-    mastery_req="frost_shield", mastery_threshold=25.0,
-    power=1.8, range=4, radius=2, aoe_falloff=0.20,
-    damage_type=DamageType.MAGICAL,
-))
-
-# ---- Rogue class skills ----
-_reg_skill(SkillDef(
-    "backstab", "Backstab",
-    "A precise strike dealing 2.2x damage with +15% crit chance.",
-    SkillType.ACTIVE, SkillTarget.SINGLE_ENEMY, HeroClass.ROGUE,
-    level_req=1, gold_cost=50, cooldown=4, stamina_cost=10,
-    power=2.2, crit_mod=0.15, range=1,
-))
-_reg_skill(SkillDef(
-    "shadowstep", "Shadowstep",
-    "Vanish briefly, boosting evasion by 40% and SPD by 30% for 2 ticks.",
-    SkillType.ACTIVE, SkillTarget.SELF, HeroClass.ROGUE,
-    level_req=3, gold_cost=100, cooldown=7, stamina_cost=12,
-    mastery_req="backstab", mastery_threshold=25.0,
-    evasion_mod=0.40, spd_mod=0.3, duration=2,
-))
-_reg_skill(SkillDef(
-    "poison_blade", "Poison Blade",
-    "Coat weapon in poison, dealing damage over 4 ticks.",
-    SkillType.ACTIVE, SkillTarget.SINGLE_ENEMY, HeroClass.ROGUE,
-    level_req=5, gold_cost=200, cooldown=10, stamina_cost=15,
-    mastery_req="shadowstep", mastery_threshold=25.0,
-    power=0.5, duration=4, range=1,  # 0.5x ATK per tick for 4 ticks
-))
-
-# ---- Race skills (innate, no class required, no gold cost) ----
-
-# Hero race skills
-_reg_skill(SkillDef(
-    "rally", "Rally",
-    "Inspire nearby allies, boosting ATK and DEF by 10% for 3 ticks.",
-    SkillType.ACTIVE, SkillTarget.AREA_ALLIES, HeroClass.NONE,
-    level_req=1, gold_cost=0, cooldown=10, stamina_cost=15,
-    atk_mod=0.1, def_mod=0.1, duration=3, range=3,
-))
-_reg_skill(SkillDef(
-    "second_wind", "Second Wind",
-    "When below 30% HP, recover 20% max HP instantly.",
-    SkillType.ACTIVE, SkillTarget.SELF, HeroClass.NONE,
-    level_req=3, gold_cost=0, cooldown=20, stamina_cost=20,
-    hp_mod=0.2,
-))
-
-# Goblin race skills
-_reg_skill(SkillDef(
-    "ambush", "Ambush",
-    "Surprise attack dealing 1.6x damage when attacking first.",
-    SkillType.ACTIVE, SkillTarget.SINGLE_ENEMY, HeroClass.NONE,
-    level_req=1, gold_cost=0, cooldown=5, stamina_cost=8,
-    power=1.6, range=1,
-))
-_reg_skill(SkillDef(
-    "scavenge", "Scavenge",
-    "Passive: increased loot drop chance.",
-    SkillType.PASSIVE, SkillTarget.SELF, HeroClass.NONE,
-))
-
-# Wolf race skills
-_reg_skill(SkillDef(
-    "pack_hunt", "Pack Hunt",
-    "Passive: +15% ATK when allies are within 3 tiles.",
-    SkillType.PASSIVE, SkillTarget.SELF, HeroClass.NONE,
-    atk_mod=0.15, range=3,
-))
-_reg_skill(SkillDef(
-    "feral_bite", "Feral Bite",
-    "A vicious bite dealing 1.7x damage.",
-    SkillType.ACTIVE, SkillTarget.SINGLE_ENEMY, HeroClass.NONE,
-    level_req=1, gold_cost=0, cooldown=4, stamina_cost=10,
-    power=1.7, range=1,
-))
-
-# Bandit race skills
-_reg_skill(SkillDef(
-    "quickdraw", "Quickdraw",
-    "A fast first strike dealing 1.5x damage with +10% crit.",
-    SkillType.ACTIVE, SkillTarget.SINGLE_ENEMY, HeroClass.NONE,
-    level_req=1, gold_cost=0, cooldown=5, stamina_cost=8,
-    power=1.5, crit_mod=0.10, range=1,
-))
-
-# Undead race skills
-_reg_skill(SkillDef(
-    "drain_life", "Drain Life",
-    "Drain enemy HP, dealing 1.3x damage and healing self for 30% of damage dealt.",
-    SkillType.ACTIVE, SkillTarget.SINGLE_ENEMY, HeroClass.NONE,
-    level_req=1, gold_cost=0, cooldown=6, stamina_cost=12,
-    power=1.3, hp_mod=0.3, range=1, damage_type=DamageType.MAGICAL,
-))
-
-# Orc race skills
-_reg_skill(SkillDef(
-    "berserker_rage", "Berserker Rage",
-    "When below 40% HP, boost ATK by 40% for 3 ticks.",
-    SkillType.ACTIVE, SkillTarget.SELF, HeroClass.NONE,
-    level_req=1, gold_cost=0, cooldown=8, stamina_cost=10,
-    atk_mod=0.4, duration=3,
-))
-_reg_skill(SkillDef(
-    "war_cry", "War Cry",
-    "Intimidate nearby enemies, reducing their ATK by 15% for 3 ticks.",
-    SkillType.ACTIVE, SkillTarget.AREA_ENEMIES, HeroClass.NONE,
-    level_req=2, gold_cost=0, cooldown=10, stamina_cost=15,
-    atk_mod=-0.15, duration=3, range=3,
-))
+_ALL_SKILLS: tuple[SkillDef, ...] = (
+    # ---- Warrior class skills ----
+    SkillDef(
+        "power_strike", "Power Strike",
+        "A devastating blow dealing 1.8x damage.",
+        SkillType.ACTIVE, SkillTarget.SINGLE_ENEMY, HeroClass.WARRIOR,
+        level_req=1, gold_cost=50, cooldown=4, stamina_cost=12,
+        power=1.8, range=1,
+    ),
+    SkillDef(
+        "shield_wall", "Shield Wall",
+        "Brace for impact, boosting DEF by 50% for 3 ticks.",
+        SkillType.ACTIVE, SkillTarget.SELF, HeroClass.WARRIOR,
+        level_req=3, gold_cost=100, cooldown=8, stamina_cost=15,
+        mastery_req="power_strike", mastery_threshold=25.0,
+        def_mod=0.5, duration=3,
+    ),
+    SkillDef(
+        "whirlwind", "Whirlwind",
+        "Spin with weapon extended, dealing 1.5x damage to all enemies within radius 1.",
+        SkillType.ACTIVE, SkillTarget.AREA_ENEMIES, HeroClass.WARRIOR,
+        level_req=5, gold_cost=200, cooldown=8, stamina_cost=20,
+        mastery_req="shield_wall", mastery_threshold=25.0,
+        power=1.5, range=1, radius=1, aoe_falloff=0.0,
+    ),
 
+    # ---- Ranger class skills ----
+    SkillDef(
+        "quick_shot", "Quick Shot",
+        "A fast ranged attack dealing 1.5x damage from up to 3 tiles away.",
+        SkillType.ACTIVE, SkillTarget.SINGLE_ENEMY, HeroClass.RANGER,
+        level_req=1, gold_cost=50, cooldown=3, stamina_cost=8,
+        power=1.5, range=3,
+    ),
+    SkillDef(
+        "evasive_step", "Evasive Step",
+        "Boost evasion by 30% for 3 ticks.",
+        SkillType.ACTIVE, SkillTarget.SELF, HeroClass.RANGER,
+        level_req=3, gold_cost=100, cooldown=7, stamina_cost=10,
+        mastery_req="quick_shot", mastery_threshold=25.0,
+        evasion_mod=0.30, duration=3,
+    ),
+    SkillDef(
+        "rain_of_arrows", "Rain of Arrows",
+        "Launch a volley of arrows into an area, dealing 1.4x damage in radius 2.",
+        SkillType.ACTIVE, SkillTarget.AREA_ENEMIES, HeroClass.RANGER,
+        level_req=5, gold_cost=200, cooldown=10, stamina_cost=18,
+        mastery_req="evasive_step", mastery_threshold=25.0,
+        power=1.4, range=4, radius=2, aoe_falloff=0.15,
+    ),
 
-# Race → default race skills mapping
-RACE_SKILLS: dict[str, list[str]] = {
-    "hero":           ["rally", "second_wind"],
-    "goblin":         ["ambush", "scavenge"],
-    "goblin_scout":   ["ambush", "scavenge"],
-    "goblin_warrior": ["ambush"],
-    "goblin_chief":   ["ambush", "scavenge"],
-    "wolf":           ["pack_hunt", "feral_bite"],
-    "dire_wolf":      ["pack_hunt", "feral_bite"],
-    "alpha_wolf":     ["pack_hunt", "feral_bite"],
-    "bandit":         ["quickdraw"],
-    "bandit_archer":  ["quickdraw"],
-    "bandit_chief":   ["quickdraw"],
-    "skeleton":       ["drain_life"],
-    "zombie":         ["drain_life"],
-    "lich":           ["drain_life"],
-    "orc":            ["berserker_rage", "war_cry"],
-    "orc_warrior":    ["berserker_rage", "war_cry"],
-    "orc_warlord":    ["berserker_rage", "war_cry"],
+    # ---- Mage class skills ----
+    SkillDef(
+        "arcane_bolt", "Arcane Bolt",
+        "Launch a magical bolt dealing 2.0x damage at range 4.",
+        SkillType.ACTIVE, SkillTarget.SINGLE_ENEMY, HeroClass.MAGE,
+        level_req=1, gold_cost=50, cooldown=4, stamina_cost=14,
+        power=2.0, range=4, damage_type=DamageType.MAGICAL,
+    ),
+    SkillDef(
+        "frost_shield", "Frost Shield",
+        "Create an ice barrier boosting DEF by 40% and slowing attackers for 3 ticks.",
+        SkillType.ACTIVE, SkillTarget.SELF, HeroClass.MAGE,
+        level_req=3, gold_cost=100, cooldown=8, stamina_cost=16,
+        mastery_req="arcane_bolt", mastery_threshold=25.0,
+        def_mod=0.4, duration=3,
+    ),
+    SkillDef(
+        "fireball", "Fireball",
+        "Hurl a ball of fire that explodes on impact, dealing 1.8x magical damage in radius 2.",
+        SkillType.ACTIVE, SkillTarget.AREA_ENEMIES, HeroClass.MAGE,
+        level_req=5, gold_cost=200, cooldown=8, stamina_cost=22,
+        mastery_req="frost_shield", mastery_threshold=25.0,
+        power=1.8, range=4, radius=2, aoe_falloff=0.20,
+        damage_type=DamageType.MAGICAL,
+    ),
+
+    # ---- Rogue class skills ----
+    SkillDef(
+        "backstab", "Backstab",
+        "A precise strike dealing 2.2x damage with +15% crit chance.",
+        SkillType.ACTIVE, SkillTarget.SINGLE_ENEMY, HeroClass.ROGUE,
+        level_req=1, gold_cost=50, cooldown=4, stamina_cost=10,
+        power=2.2, crit_mod=0.15, range=1,
+    ),
+    SkillDef(
+        "shadowstep", "Shadowstep",
+        "Vanish briefly, boosting evasion by 40% and SPD by 30% for 2 ticks.",
+        SkillType.ACTIVE, SkillTarget.SELF, HeroClass.ROGUE,
+        level_req=3, gold_cost=100, cooldown=7, stamina_cost=12,
+        mastery_req="backstab", mastery_threshold=25.0,
+        evasion_mod=0.40, spd_mod=0.3, duration=2,
+    ),
+    SkillDef(
+        "poison_blade", "Poison Blade",
+        "Coat weapon in poison, dealing damage over 4 ticks.",
+        SkillType.ACTIVE, SkillTarget.SINGLE_ENEMY, HeroClass.ROGUE,
+        level_req=5, gold_cost=200, cooldown=10, stamina_cost=15,
+        mastery_req="shadowstep", mastery_threshold=25.0,
+        power=0.5, duration=4, range=1,  # 0.5x ATK per tick for 4 ticks
+    ),
+
+    # ---- Race skills (innate, no class required, no gold cost) ----
+
+    # Hero race skills
+    SkillDef(
+        "rally", "Rally",
+        "Inspire nearby allies, boosting ATK and DEF by 10% for 3 ticks.",
+        SkillType.ACTIVE, SkillTarget.AREA_ALLIES, HeroClass.NONE,
+        level_req=1, gold_cost=0, cooldown=10, stamina_cost=15,
+        atk_mod=0.1, def_mod=0.1, duration=3, range=3,
+    ),
+    SkillDef(
+        "second_wind", "Second Wind",
+        "When below 30% HP, recover 20% max HP instantly.",
+        SkillType.ACTIVE, SkillTarget.SELF, HeroClass.NONE,
+        level_req=3, gold_cost=0, cooldown=20, stamina_cost=20,
+        hp_mod=0.2,
+    ),
+
+    # Goblin race skills
+    SkillDef(
+        "ambush", "Ambush",
+        "Surprise attack dealing 1.6x damage when attacking first.",
+        SkillType.ACTIVE, SkillTarget.SINGLE_ENEMY, HeroClass.NONE,
+        level_req=1, gold_cost=0, cooldown=5, stamina_cost=8,
+        power=1.6, range=1,
+    ),
+    SkillDef(
+        "scavenge", "Scavenge",
+        "Passive: increased loot drop chance.",
+        SkillType.PASSIVE, SkillTarget.SELF, HeroClass.NONE,
+    ),
+
+    # Wolf race skills
+    SkillDef(
+        "pack_hunt", "Pack Hunt",
+        "Passive: +15% ATK when allies are within 3 tiles.",
+        SkillType.PASSIVE, SkillTarget.SELF, HeroClass.NONE,
+        atk_mod=0.15, range=3,
+    ),
+    SkillDef(
+        "feral_bite", "Feral Bite",
+        "A vicious bite dealing 1.7x damage.",
+        SkillType.ACTIVE, SkillTarget.SINGLE_ENEMY, HeroClass.NONE,
+        level_req=1, gold_cost=0, cooldown=4, stamina_cost=10,
+        power=1.7, range=1,
+    ),
+
+    # Bandit race skills
+    SkillDef(
+        "quickdraw", "Quickdraw",
+        "A fast first strike dealing 1.5x damage with +10% crit.",
+        SkillType.ACTIVE, SkillTarget.SINGLE_ENEMY, HeroClass.NONE,
+        level_req=1, gold_cost=0, cooldown=5, stamina_cost=8,
+        power=1.5, crit_mod=0.10, range=1,
+    ),
+
+    # Undead race skills
+    SkillDef(
+        "drain_life", "Drain Life",
+        "Drain enemy HP, dealing 1.3x damage and healing self for 30% of damage dealt.",
+        SkillType.ACTIVE, SkillTarget.SINGLE_ENEMY, HeroClass.NONE,
+        level_req=1, gold_cost=0, cooldown=6, stamina_cost=12,
+        power=1.3, hp_mod=0.3, range=1, damage_type=DamageType.MAGICAL,
+    ),
+
+    # Orc race skills
+    SkillDef(
+        "berserker_rage", "Berserker Rage",
+        "When below 40% HP, boost ATK by 40% for 3 ticks.",
+        SkillType.ACTIVE, SkillTarget.SELF, HeroClass.NONE,
+        level_req=1, gold_cost=0, cooldown=8, stamina_cost=10,
+        atk_mod=0.4, duration=3,
+    ),
+    SkillDef(
+        "war_cry", "War Cry",
+        "Intimidate nearby enemies, reducing their ATK by 15% for 3 ticks.",
+        SkillType.ACTIVE, SkillTarget.AREA_ENEMIES, HeroClass.NONE,
+        level_req=2, gold_cost=0, cooldown=10, stamina_cost=15,
+        atk_mod=-0.15, duration=3, range=3,
+    ),
+)
+
+# Intern ids so registry probes and skill_id == mastery_req checks
+# hit CPython's identity fast path even for ids built at runtime.
+for _s in _ALL_SKILLS:
+    if _s.mastery_req:
+        object.__setattr__(_s, "mastery_req", sys.intern(_s.mastery_req))
+del _s
+
+SKILL_DEFS: Mapping[str, SkillDef] = MappingProxyType(
+    {sys.intern(s.skill_id): s for s in _ALL_SKILLS}
+)
+
+
+# Skill id → precomputed effect multipliers (1.0 + mod) for atk/def/spd/crit/evasion.
+# Only skills with at least one non-zero modifier are present.
+SKILL_EFFECT_MULTS: dict[str, tuple[float, float, float, float, float]] = {
+    sid: (1.0 + s.atk_mod, 1.0 + s.def_mod, 1.0 + s.spd_mod,
+          1.0 + s.crit_mod, 1.0 + s.evasion_mod)
+    for sid, s in SKILL_DEFS.items()
+    if s.atk_mod or s.def_mod or s.spd_mod or s.crit_mod or s.evasion_mod
 }
 
 
+def _tier_costs(sdef: SkillDef) -> tuple[tuple[int, int], ...]:
+    probe = SkillInstance(sdef.skill_id)
+    rows = []
+    for mastery in (0.0,) + _TIER_THRESHOLDS:
+        probe.mastery = mastery
+        rows.append((probe.effective_stamina_cost(sdef.stamina_cost),
+                     probe.effective_cooldown(sdef.cooldown)))
+    return tuple(rows)
+
+
+# Skill id → (effective stamina cost, effective cooldown) per mastery tier.
+SKILL_COSTS: Mapping[str, tuple[tuple[int, int], ...]] = MappingProxyType(
+    {sid: _tier_costs(s) for sid, s in SKILL_DEFS.items()}
+)
+
+
+# Race → default race skills mapping
+RACE_SKILLS: Mapping[str, tuple[str, ...]] = MappingProxyType({
+    "hero":           ("rally", "second_wind"),
+    "goblin":         ("ambush", "scavenge"),
+    "goblin_scout":   ("ambush", "scavenge"),
+    "goblin_warrior": ("ambush",),
+    "goblin_chief":   ("ambush", "scavenge"),
+    "wolf":           ("pack_hunt", "feral_bite"),
+    "dire_wolf":      ("pack_hunt", "feral_bite"),
+    "alpha_wolf":     ("pack_hunt", "feral_bite"),
+    "bandit":         ("quickdraw",),
+    "bandit_archer":  ("quickdraw",),
+    "bandit_chief":   ("quickdraw",),
+    "skeleton":       ("drain_life",),
+    "zombie":         ("drain_life",),
+    "lich":           ("drain_life",),
+    "orc":            ("berserker_rage", "war_cry"),
+    "orc_warrior":    ("berserker_rage", "war_cry"),
+    "orc_warlord":    ("berserker_rage", "war_cry"),
+})
+
+
 # Class → available class skills mapping
-CLASS_SKILLS: dict[HeroClass, list[str]] = {
-    HeroClass.WARRIOR: ["power_strike", "shield_wall", "whirlwind"],
-    HeroClass.RANGER:  ["quick_shot", "evasive_step", "rain_of_arrows"],
-    HeroClass.MAGE:    ["arcane_bolt", "frost_shield", "fireball"],
-    HeroClass.ROGUE:   ["backstab", "shadowstep", "poison_blade"],
-    # Breakthroughs inherit parent class skills
-    HeroClass.CHAMPION:    ["power_strike", "shield_wall", "whirlwind"],
-    HeroClass.SHARPSHOOTER: ["quick_shot", "evasive_step", "rain_of_arrows"],
-    HeroClass.ARCHMAGE:    ["arcane_bolt", "frost_shield", "fireball"],
-    HeroClass.ASSASSIN:    ["backstab", "shadowstep", "poison_blade"],
+CLASS_SKILLS: dict[HeroClass, tuple[str, ...]] = {
+    HeroClass.WARRIOR: ("power_strike", "shield_wall", "whirlwind"),
+    HeroClass.RANGER:  ("quick_shot", "evasive_step", "rain_of_arrows"),
+    HeroClass.MAGE:    ("arcane_bolt", "frost_shield", "fireball"),
+    HeroClass.ROGUE:   ("backstab", "shadowstep", "poison_blade"),
 }
 
+# Breakthroughs inherit parent class skills (shared, not copied)
+for _base, _bt in (
+    (HeroClass.WARRIOR, HeroClass.CHAMPION),
+    (HeroClass.RANGER, HeroClass.SHARPSHOOTER),
+    (HeroClass.MAGE, HeroClass.ARCHMAGE),
+    (HeroClass.ROGUE, HeroClass.ASSASSIN),
+):
+    CLASS_SKILLS[_bt] = CLASS_SKILLS[_base]
+del _base, _bt
+
+# Class id → (sorted level_reqs, skill_ids in the same order) for bisect lookup.
+# Keyed by plain int so hot-path probes hash as ints, not IntEnum members.
+_CLASS_SKILLS_BY_LVL: dict[int, tuple[list[int], tuple[str, ...]]] = {}
+for _hc, _sids in CLASS_SKILLS.items():
+    _ordered = sorted(
+        (sid for sid in _sids if sid in SKILL_DEFS),
+        key=lambda sid: SKILL_DEFS[sid].level_req,
+    )
+    _CLASS_SKILLS_BY_LVL[int(_hc)] = (
+        [SKILL_DEFS[sid].level_req for sid in _ordered], tuple(_ordered),
+    )
+del _hc, _sids, _ordered
+
 
 # Class building type → class mapping
 CLASS_BUILDING_MAP: dict[str, HeroClass] = {
@@ -810,61 +917,80 @@ HERO_STARTING_GEAR: dict[HeroClass, dict[str, str | None]] = {
 # Helper functions
 # ---------------------------------------------------------------------------
 
+# Attribute short name → getter (built once; avoids a dict literal per call)
+_ATTR_GETTERS = {
+    "str": attrgetter("str_"), "agi": attrgetter("agi"), "vit": attrgetter("vit"),
+    "int": attrgetter("int_"), "spi": attrgetter("spi"), "wis": attrgetter("wis"),
+    "end": attrgetter("end"), "per": attrgetter("per"), "cha": attrgetter("cha"),
+}
+
+
 def get_attr_value(attrs, attr_name: str) -> int:
     """Get attribute value by string name."""
-    mapping = {"str": attrs.str_, "agi": attrs.agi, "vit": attrs.vit,
-               "int": attrs.int_, "spi": attrs.spi, "wis": attrs.wis,
-               "end": attrs.end, "per": attrs.per, "cha": attrs.cha}
-    return mapping.get(attr_name, 0)
+    getter = _ATTR_GETTERS.get(attr_name)
+    return getter(attrs) if getter is not None else 0
+
+
+@lru_cache(maxsize=None)
+def _breakthrough_req(hero_class: HeroClass, level: int):
+    """Resolve the static part of a breakthrough check.
+
+    Returns (attr getter or None, threshold) when *hero_class* has a
+    breakthrough and *level* meets it, else None.  Requirements are fixed
+    at import, so only the live attribute read is left per call.
+    """
+    bt = _BREAKTHROUGHS_BY_ID.get(int(hero_class))
+    if bt is None or level < bt.level_req:
+        return None
+    return _ATTR_GETTERS.get(bt.attr_req), bt.attr_threshold
 
 
 def can_breakthrough(hero_class: HeroClass, level: int, attrs) -> bool:
     """Check if an entity can breakthrough to the next class."""
-    bt = BREAKTHROUGHS.get(hero_class)
-    if bt is None:
+    req = _breakthrough_req(hero_class, level)
+    if req is None:
         return False
-    if level < bt.level_req:
-        return False
-    return get_attr_value(attrs, bt.attr_req) >= bt.attr_threshold
+    getter, threshold = req
+    return (getter(attrs) if getter is not None else 0) >= threshold
+
 
+@lru_cache(maxsize=None)
+def available_class_skills(hero_class: HeroClass, level: int) -> tuple[str, ...]:
+    """Get skill IDs available for a class at a given level (ignores mastery).
 
-def available_class_skills(hero_class: HeroClass, level: int) -> list[str]:
-    """Get skill IDs available for a class at a given level (ignores mastery)."""
-    skill_ids = CLASS_SKILLS.get(hero_class, [])
-    result = []
-    for sid in skill_ids:
-        sdef = SKILL_DEFS.get(sid)
-        if sdef and level >= sdef.level_req:
-            result.append(sid)
-    return result
+    Memoized on (hero_class, level) — the skill registries are fixed at
+    import, so the answer never changes.  Returns a tuple so the cached
+    value cannot be mutated by callers.
+    """
+    entry = _CLASS_SKILLS_BY_LVL.get(int(hero_class))
+    if entry is None:
+        return ()
+    reqs, sids = entry
+    return sids[:bisect_right(reqs, level)]
 
 
 def can_learn_skill(
     sdef: SkillDef,
     level: int,
-    known_skills: list[SkillInstance],
+    known_skills: Mapping[str, SkillInstance],
     class_mastery: float = 0.0,
 ) -> tuple[bool, str]:
     """Check whether a hero meets all requirements to learn a skill.
 
+    *known_skills* maps skill_id → SkillInstance for the hero's learned skills.
     Returns (can_learn, reason_if_not).
     """
     if level < sdef.level_req:
         return False, f"Requires level {sdef.level_req} (current: {level})"
     if sdef.mastery_req:
-        prereq = None
-        for si in known_skills:
-            if si.skill_id == sdef.mastery_req:
-                prereq = si
-                break
+        prereq = known_skills.get(sdef.mastery_req)
+        if prereq is not None and prereq.mastery >= sdef.mastery_threshold:
+            return True, ""
+        prereq_def = SKILL_DEFS.get(sdef.mastery_req)
+        prereq_name = prereq_def.name if prereq_def else sdef.mastery_req
         if prereq is None:
-            prereq_def = SKILL_DEFS.get(sdef.mastery_req)
-            prereq_name = prereq_def.name if prereq_def else sdef.mastery_req
             return False, f"Requires knowledge of {prereq_name}"
-        if prereq.mastery < sdef.mastery_threshold:
-            prereq_def = SKILL_DEFS.get(sdef.mastery_req)
-            prereq_name = prereq_def.name if prereq_def else sdef.mastery_req
-            return False, f"Requires {prereq_name} mastery {sdef.mastery_threshold:.0f}+ (current: {prereq.mastery:.0f})"
+        return False, f"Requires {prereq_name} mastery {sdef.mastery_threshold:.0f}+ (current: {prereq.mastery:.0f})"
     return True, ""
 
 
@@ -3,7 +3,8 @@
 Design:
   - Effects are lightweight dataclasses attached to an entity.
   - Each effect has a type, stat multipliers, and a remaining duration (ticks).
-  - The WorldLoop ticks down durations and removes expired effects.
+  - The WorldLoop ticks down durations and removes expired effects
+    (remaining_ticks == 0).
   - Entity.effective_*() methods query active effects for multipliers.
   - New effect types can be added by extending EffectType and creating
     factory functions.
@@ -52,27 +53,26 @@ class StatusEffect:
     # Flat modifiers (applied after multipliers)
     hp_per_tick: int = 0        # Positive = regen, negative = DoT
 
-    @property
-    def expired(self) -> bool:
-        return self.remaining_ticks == 0
-
     def tick(self) -> None:
         """Decrement remaining duration.  Does nothing if permanent (-1)."""
         if self.remaining_ticks > 0:
             self.remaining_ticks -= 1
 
-    def copy(self) -> StatusEffect:
-        return StatusEffect(
-            effect_type=self.effect_type,
-            remaining_ticks=self.remaining_ticks,
-            source=self.source,
-            atk_mult=self.atk_mult,
-            def_mult=self.def_mult,
-            spd_mult=self.spd_mult,
-            crit_mult=self.crit_mult,
-            evasion_mult=self.evasion_mult,
-            hp_per_tick=self.hp_per_tick,
-        )
+    def __copy__(self) -> StatusEffect:
+        # Bypass the generated __init__ and write slots directly
+        new = StatusEffect.__new__(StatusEffect)
+        new.effect_type = self.effect_type
+        new.remaining_ticks = self.remaining_ticks
+        new.source = self.source
+        new.atk_mult = self.atk_mult
+        new.def_mult = self.def_mult
+        new.spd_mult = self.spd_mult
+        new.crit_mult = self.crit_mult
+        new.evasion_mult = self.evasion_mult
+        new.hp_per_tick = self.hp_per_tick
+        return new
+
+    copy = __copy__
 
 
 # ---------------------------------------------------------------------------
@@ -127,6 +127,21 @@ def skill_effect(
     )
 
 
+def skill_effect_from_mults(
+    mults: tuple[float, float, float, float, float],
+    duration: int,
+    source: str,
+    is_debuff: bool = False,
+) -> StatusEffect:
+    """Create a skill buff or debuff from precomputed multipliers.
+
+    *mults* is (atk, def, spd, crit, evasion) as already-offset multipliers,
+    e.g. an entry of ``SKILL_EFFECT_MULTS`` — no per-application arithmetic.
+    """
+    etype = EffectType.SKILL_DEBUFF if is_debuff else EffectType.SKILL_BUFF
+    return StatusEffect(etype, duration, source, *mults)
+
+
 def territory_buff(
     atk_mult: float = 1.1,
     def_mult: float = 1.1,
@@ -21,12 +21,15 @@ Usage::
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import sys
+from functools import lru_cache
+from itertools import groupby
+from typing import TYPE_CHECKING, Final
 
 from src.core.attributes import Attributes, AttributeCaps, recalc_derived_stats
 from src.core.classes import (
-    CLASS_DEFS, RACE_SKILLS, SKILL_DEFS, SkillInstance,
-    available_class_skills,
+    CLASS_BONUSES, CLASS_CAP_BONUSES, RACE_SKILLS, SKILL_DEFS, SkillInstance,
+    available_class_skills, mob_class_for,
 )
 from src.core.enums import AIState, Domain, EntityRole
 from src.core.faction import Faction
@@ -37,6 +40,87 @@ from src.core.traits import assign_traits
 if TYPE_CHECKING:
     from src.systems.rng import DeterministicRNG
 
+# Shared default position; Vector2 is frozen so one instance is safe to reuse
+_ORIGIN: Final[Vector2] = Vector2(0, 0)
+
+# Inclusive upper bounds for batched spawn draws (see next_ints_bounded)
+_RANDOM_STAT_HIGHS = (15, 4, 3, 2)                  # hp, atk, spd, def
+_HERO_ATTR_HIGHS = (2, 2, 2, 2, 2, 2, 2, 2, 2)
+_MOB_ATTR_HIGHS = (3, 3, 3, 2, 2, 3, 2, 2, 2)       # str, agi, vit, int, wis, end, spi, per, cha
+_ZERO_ATTRS = (0, 0, 0, 0, 0, 0, 0, 0, 0)
+# Starting stamina (before attribute derivation) per entity kind
+_BASE_STAMINA: dict[str, int] = {"hero": 50}
+_DEFAULT_BASE_STAMINA = 30
+
+# Default numeric base stats, in EntityBuilder._base order
+_DEFAULT_BASE = (20, 5, 0, 10, 0, 0.05, 1.5, 0.0, 1, 100, 0)
+
+
+@lru_cache(maxsize=None)
+def _race_skill_ids(race: str) -> tuple[str, ...]:
+    """Race skill ids that resolve to a registered SkillDef."""
+    return tuple(sid for sid in RACE_SKILLS.get(race, ()) if sid in SKILL_DEFS)
+
+
+@lru_cache(maxsize=None)
+def _mob_template(
+    race: str, kind: str, tier: int,
+) -> tuple[str, int, tuple[int, ...] | None, tuple[int, ...] | None, tuple[str, ...]]:
+    """Immutable per-(race, kind, tier) spawn template.
+
+    Holds everything about a mob spawn that does not depend on the RNG:
+    (interned kind, mob class id, class bonuses, class cap bonuses,
+    race skill ids).
+    """
+    mob_cls = int(mob_class_for(race, tier))
+    return (
+        sys.intern(kind), mob_cls, CLASS_BONUSES[mob_cls], CLASS_CAP_BONUSES[mob_cls],
+        _race_skill_ids(kind),
+    )
+
+
+@lru_cache(maxsize=64)
+def _mob_cap_values(tier: int, cap_bonus: tuple[int, ...]) -> tuple[int, ...]:
+    """Attribute caps for a mob of *tier*, in Attributes field order.
+
+    Caps never depend on RNG draws, so one tuple serves every mob of the
+    same tier and class. Callers still build a fresh AttributeCaps from it
+    because ``level_up_attributes`` grows caps in place.
+    """
+    phys = 15 + tier * 5
+    ment = 10 + tier * 3
+    c0, c1, c2, c3, c4, c5, c6, c7, c8 = cap_bonus
+    return (
+        phys + c0, phys + c1, phys + c2, ment + c3, ment + c4,
+        ment + c5, phys + c6, ment + c7, 8 + tier * 2 + c8,
+    )
+
+
+def _mob_attr_kernel(
+    attr_base: int, bonus: tuple[int, ...],
+    mods: tuple[int, ...], draws: tuple[int, ...],
+) -> tuple[int, ...]:
+    """Pure integer math for mob/race attributes.
+
+    Every 9-tuple argument and the returned 9-tuple are in Attributes
+    field order: str, agi, vit, int, spi, wis, end, per, cha.
+    """
+    mx = max  # local: avoids nine builtins lookups
+    b0, b1, b2, b3, b4, b5, b6, b7, b8 = bonus
+    m0, m1, m2, m3, m4, m5, m6, m7, m8 = mods
+    d0, d1, d2, d3, d4, d5, d6, d7, d8 = draws
+    return (
+        mx(1, attr_base + m0 + b0 + d0),
+        mx(1, attr_base + m1 + b1 + d1),
+        mx(1, attr_base + m2 + b2 + d2),
+        mx(1, attr_base - 2 + m3 + b3 + d3),
+        mx(1, attr_base - 2 + m4 + b4 + d4),
+        mx(1, attr_base - 2 + m5 + b5 + d5),
+        mx(1, attr_base + m6 + b6 + d6),
+        mx(1, attr_base - 1 + m7 + b7 + d7),
+        mx(1, attr_base - 3 + m8 + b8 + d8),
+    )
+
 
 class EntityBuilder:
     """Fluent builder for Entity construction.
@@ -49,10 +133,8 @@ class EntityBuilder:
         "_rng", "_eid", "_tick",
         "_kind", "_pos", "_ai_state", "_faction", "_role",
         "_home_pos", "_leash_radius", "_tier",
-        "_base_hp", "_base_atk", "_base_def", "_base_spd",
-        "_luck", "_crit_rate", "_crit_dmg", "_evasion",
-        "_level", "_xp", "_xp_to_next", "_gold",
-        "_hero_class", "_class_def",
+        "_base",
+        "_hero_class", "_class_bonus", "_class_cap_bonus",
         "_attrs", "_caps",
         "_skills", "_inventory", "_home_storage", "_traits",
         "_attr_base", "_attr_randomness",
@@ -64,13 +146,26 @@ class EntityBuilder:
         entity_id: int,
         tick: int = 0,
     ) -> None:
+        self.reset(rng, entity_id, tick)
+
+    def reset(
+        self,
+        rng: DeterministicRNG,
+        entity_id: int,
+        tick: int = 0,
+    ) -> EntityBuilder:
+        """Rebind to a new entity and restore every default, for reuse.
+
+        The skill and trait lists are replaced rather than cleared because
+        ``build()`` hands them to the Entity it returns.
+        """
         self._rng = rng
         self._eid = entity_id
         self._tick = tick
 
         # Defaults
         self._kind: str = "unknown"
-        self._pos: Vector2 = Vector2(0, 0)
+        self._pos: Vector2 = _ORIGIN
         self._ai_state: AIState = AIState.WANDER
         self._faction: Faction = Faction.HERO_GUILD
         self._role: EntityRole = EntityRole.MOB
@@ -78,34 +173,27 @@ class EntityBuilder:
         self._leash_radius: int = 0
         self._tier: int = 0
 
-        self._base_hp: int = 20
-        self._base_atk: int = 5
-        self._base_def: int = 0
-        self._base_spd: int = 10
-        self._luck: int = 0
-        self._crit_rate: float = 0.05
-        self._crit_dmg: float = 1.5
-        self._evasion: float = 0.0
-        self._level: int = 1
-        self._xp: int = 0
-        self._xp_to_next: int = 100
-        self._gold: int = 0
+        # (hp, atk, def, spd, luck, crit_rate, crit_dmg, evasion, level, xp_to_next, gold)
+        self._base: tuple = _DEFAULT_BASE
 
         self._hero_class: int | None = None
-        self._class_def = None
+        self._class_bonus: tuple[int, ...] | None = None
+        self._class_cap_bonus: tuple[int, ...] | None = None
         self._attrs: Attributes | None = None
         self._caps: AttributeCaps | None = None
         self._skills: list[SkillInstance] = []
         self._inventory: Inventory | None = None
         self._home_storage: HomeStorage | None = None
         self._traits: list[int] = []
+        return self
 
     # -------------------------------------------------------------------
     # Identity
     # -------------------------------------------------------------------
 
     def kind(self, kind: str) -> EntityBuilder:
-        self._kind = kind
+        # Interned so kind-keyed dict probes hit the identity fast path
+        self._kind = sys.intern(kind)
         return self
 
     def at(self, pos: Vector2) -> EntityBuilder:
@@ -147,26 +235,18 @@ class EntityBuilder:
         evasion: float = 0.0, level: int = 1, xp_to_next: int = 100,
         gold: int = 0,
     ) -> EntityBuilder:
-        self._base_hp = hp
-        self._base_atk = atk
-        self._base_def = def_
-        self._base_spd = spd
-        self._luck = luck
-        self._crit_rate = crit_rate
-        self._crit_dmg = crit_dmg
-        self._evasion = evasion
-        self._level = level
-        self._xp_to_next = xp_to_next
-        self._gold = gold
+        self._base = (
+            hp, atk, def_, spd, luck, crit_rate, crit_dmg, evasion, level, xp_to_next, gold,
+        )
         return self
 
     def with_randomized_stats(self) -> EntityBuilder:
         """Add RNG variance to base stats (typical for hero spawns)."""
-        eid = self._eid
-        self._base_hp += self._rng.next_int(Domain.SPAWN, eid, self._tick + 2, 0, 15)
-        self._base_atk += self._rng.next_int(Domain.SPAWN, eid, self._tick + 3, 0, 4)
-        self._base_spd += self._rng.next_int(Domain.SPAWN, eid, self._tick + 4, 0, 3)
-        self._base_def += self._rng.next_int(Domain.SPAWN, eid, self._tick + 5, 0, 2)
+        d_hp, d_atk, d_spd, d_def = self._rng.next_ints_bounded(
+            Domain.SPAWN, self._eid, self._tick + 2, _RANDOM_STAT_HIGHS,
+        )
+        hp, atk, def_, spd, *rest = self._base
+        self._base = (hp + d_hp, atk + d_atk, def_ + d_def, spd + d_spd, *rest)
         return self
 
     # -------------------------------------------------------------------
@@ -175,84 +255,61 @@ class EntityBuilder:
 
     def with_hero_class(self, hero_class) -> EntityBuilder:
         """Set hero class and derive attributes from class definition."""
-        self._hero_class = int(hero_class)
-        self._class_def = CLASS_DEFS.get(hero_class)
-        if self._class_def:
-            cdef = self._class_def
-            eid = self._eid
-            rng = self._rng
-            tick = self._tick
+        hc = self._hero_class = int(hero_class)
+        bonus = CLASS_BONUSES[hc]
+        if bonus is not None:
+            cap_bonus = CLASS_CAP_BONUSES[hc]
+            self._class_bonus = bonus
+            self._class_cap_bonus = cap_bonus
+            # Draws at tick+10..18 in order: str, agi, vit, int, wis, end, spi, per, cha
+            d_str, d_agi, d_vit, d_int, d_wis, d_end, d_spi, d_per, d_cha = (
+                self._rng.next_ints_bounded(
+                    Domain.SPAWN, self._eid, self._tick + 10, _HERO_ATTR_HIGHS,
+                )
+            )
+            b_str, b_agi, b_vit, b_int, b_spi, b_wis, b_end, b_per, b_cha = bonus
             self._attrs = Attributes(
-                str_=5 + cdef.str_bonus + rng.next_int(Domain.SPAWN, eid, tick + 10, 0, 2),
-                agi=5 + cdef.agi_bonus + rng.next_int(Domain.SPAWN, eid, tick + 11, 0, 2),
-                vit=5 + cdef.vit_bonus + rng.next_int(Domain.SPAWN, eid, tick + 12, 0, 2),
-                int_=5 + cdef.int_bonus + rng.next_int(Domain.SPAWN, eid, tick + 13, 0, 2),
-                spi=5 + cdef.spi_bonus + rng.next_int(Domain.SPAWN, eid, tick + 16, 0, 2),
-                wis=5 + cdef.wis_bonus + rng.next_int(Domain.SPAWN, eid, tick + 14, 0, 2),
-                end=5 + cdef.end_bonus + rng.next_int(Domain.SPAWN, eid, tick + 15, 0, 2),
-                per=5 + cdef.per_bonus + rng.next_int(Domain.SPAWN, eid, tick + 17, 0, 2),
-                cha=5 + cdef.cha_bonus + rng.next_int(Domain.SPAWN, eid, tick + 18, 0, 2),
+                5 + b_str + d_str, 5 + b_agi + d_agi, 5 + b_vit + d_vit,
+                5 + b_int + d_int, 5 + b_spi + d_spi, 5 + b_wis + d_wis,
+                5 + b_end + d_end, 5 + b_per + d_per, 5 + b_cha + d_cha,
             )
+            c_str, c_agi, c_vit, c_int, c_spi, c_wis, c_end, c_per, c_cha = cap_bonus
             self._caps = AttributeCaps(
-                str_cap=15 + cdef.str_cap_bonus, agi_cap=15 + cdef.agi_cap_bonus,
-                vit_cap=15 + cdef.vit_cap_bonus, int_cap=15 + cdef.int_cap_bonus,
-                spi_cap=15 + cdef.spi_cap_bonus, wis_cap=15 + cdef.wis_cap_bonus,
-                end_cap=15 + cdef.end_cap_bonus, per_cap=15 + cdef.per_cap_bonus,
-                cha_cap=15 + cdef.cha_cap_bonus,
+                15 + c_str, 15 + c_agi, 15 + c_vit, 15 + c_int, 15 + c_spi,
+                15 + c_wis, 15 + c_end, 15 + c_per, 15 + c_cha,
             )
+        else:
+            self._class_bonus = self._class_cap_bonus = None
         return self
 
     def with_mob_class(self, mob_class) -> EntityBuilder:
         """Set mob archetype class and apply its attribute bonuses."""
-        self._hero_class = int(mob_class)
-        cdef = CLASS_DEFS.get(mob_class)
-        if cdef:
-            self._class_def = cdef
+        hc = self._hero_class = int(mob_class)
+        bonus = CLASS_BONUSES[hc]
+        if bonus is not None:
+            self._class_bonus = bonus
+            self._class_cap_bonus = CLASS_CAP_BONUSES[hc]
+        return self
+
+    def from_mob_template(self, race: str, kind: str, tier: int) -> EntityBuilder:
+        """Apply the cached, RNG-independent part of a mob spawn.
+
+        Equivalent to ``.kind(kind).tier(tier).with_mob_class(mob_class_for(race, tier))
+        .with_race_skills(kind)``; must precede ``with_*_attributes``.
+        """
+        kind, mob_cls, bonus, cap_bonus, skill_ids = _mob_template(race, kind, tier)
+        self._kind = kind
+        self._tier = tier
+        self._hero_class = mob_cls
+        if bonus is not None:
+            self._class_bonus = bonus
+            self._class_cap_bonus = cap_bonus
+        self._skills.extend(map(SkillInstance, skill_ids))
         return self
 
     def with_mob_attributes(self, attr_base: int, tier: int) -> EntityBuilder:
         """Generate mob-style attributes scaled by tier + class bonuses."""
-        eid = self._eid
-        rng = self._rng
-        tick = self._tick
-        # Class bonuses (from with_mob_class or with_hero_class)
-        cd = self._class_def
-        c_str = cd.str_bonus if cd else 0
-        c_agi = cd.agi_bonus if cd else 0
-        c_vit = cd.vit_bonus if cd else 0
-        c_int = cd.int_bonus if cd else 0
-        c_spi = cd.spi_bonus if cd else 0
-        c_wis = cd.wis_bonus if cd else 0
-        c_end = cd.end_bonus if cd else 0
-        c_per = cd.per_bonus if cd else 0
-        c_cha = cd.cha_bonus if cd else 0
-        self._attrs = Attributes(
-            str_=max(1, attr_base + c_str + rng.next_int(Domain.SPAWN, eid, tick + 20, 0, 3)),
-            agi=max(1, attr_base + c_agi + rng.next_int(Domain.SPAWN, eid, tick + 21, 0, 3)),
-            vit=max(1, attr_base + c_vit + rng.next_int(Domain.SPAWN, eid, tick + 22, 0, 3)),
-            int_=max(1, attr_base - 2 + c_int + rng.next_int(Domain.SPAWN, eid, tick + 23, 0, 2)),
-            spi=max(1, attr_base - 2 + c_spi + rng.next_int(Domain.SPAWN, eid, tick + 26, 0, 2)),
-            wis=max(1, attr_base - 2 + c_wis + rng.next_int(Domain.SPAWN, eid, tick + 24, 0, 2)),
-            end=max(1, attr_base + c_end + rng.next_int(Domain.SPAWN, eid, tick + 25, 0, 3)),
-            per=max(1, attr_base - 1 + c_per + rng.next_int(Domain.SPAWN, eid, tick + 27, 0, 2)),
-            cha=max(1, attr_base - 3 + c_cha + rng.next_int(Domain.SPAWN, eid, tick + 28, 0, 2)),
-        )
-        cc_str = cd.str_cap_bonus if cd else 0
-        cc_agi = cd.agi_cap_bonus if cd else 0
-        cc_vit = cd.vit_cap_bonus if cd else 0
-        cc_int = cd.int_cap_bonus if cd else 0
-        cc_spi = cd.spi_cap_bonus if cd else 0
-        cc_wis = cd.wis_cap_bonus if cd else 0
-        cc_end = cd.end_cap_bonus if cd else 0
-        cc_per = cd.per_cap_bonus if cd else 0
-        cc_cha = cd.cha_cap_bonus if cd else 0
-        self._caps = AttributeCaps(
-            str_cap=15 + tier * 5 + cc_str, agi_cap=15 + tier * 5 + cc_agi,
-            vit_cap=15 + tier * 5 + cc_vit, int_cap=10 + tier * 3 + cc_int,
-            spi_cap=10 + tier * 3 + cc_spi, wis_cap=10 + tier * 3 + cc_wis,
-            end_cap=15 + tier * 5 + cc_end, per_cap=10 + tier * 3 + cc_per,
-            cha_cap=8 + tier * 2 + cc_cha,
-        )
+        self._attrs, self._caps = self._derive_mob_attributes(attr_base, tier, _ZERO_ATTRS)
         return self
 
     def with_race_attributes(
@@ -261,64 +318,44 @@ class EntityBuilder:
         r_spi: int = 0, r_per: int = 0, r_cha: int = 0,
     ) -> EntityBuilder:
         """Generate race-specific attributes with racial + class modifiers."""
-        eid = self._eid
-        rng = self._rng
-        tick = self._tick
-        # Class bonuses (from with_mob_class)
-        cd = self._class_def
-        c_str = cd.str_bonus if cd else 0
-        c_agi = cd.agi_bonus if cd else 0
-        c_vit = cd.vit_bonus if cd else 0
-        c_int = cd.int_bonus if cd else 0
-        c_spi = cd.spi_bonus if cd else 0
-        c_wis = cd.wis_bonus if cd else 0
-        c_end = cd.end_bonus if cd else 0
-        c_per = cd.per_bonus if cd else 0
-        c_cha = cd.cha_bonus if cd else 0
-        self._attrs = Attributes(
-            str_=max(1, attr_base + r_str + c_str + rng.next_int(Domain.SPAWN, eid, tick + 20, 0, 3)),
-            agi=max(1, attr_base + r_agi + c_agi + rng.next_int(Domain.SPAWN, eid, tick + 21, 0, 3)),
-            vit=max(1, attr_base + r_vit + c_vit + rng.next_int(Domain.SPAWN, eid, tick + 22, 0, 3)),
-            int_=max(1, attr_base - 2 + c_int + rng.next_int(Domain.SPAWN, eid, tick + 23, 0, 2)),
-            spi=max(1, attr_base - 2 + r_spi + c_spi + rng.next_int(Domain.SPAWN, eid, tick + 26, 0, 2)),
-            wis=max(1, attr_base - 2 + c_wis + rng.next_int(Domain.SPAWN, eid, tick + 24, 0, 2)),
-            end=max(1, attr_base + c_end + rng.next_int(Domain.SPAWN, eid, tick + 25, 0, 3)),
-            per=max(1, attr_base - 1 + r_per + c_per + rng.next_int(Domain.SPAWN, eid, tick + 27, 0, 2)),
-            cha=max(1, attr_base - 3 + r_cha + c_cha + rng.next_int(Domain.SPAWN, eid, tick + 28, 0, 2)),
-        )
-        cc_str = cd.str_cap_bonus if cd else 0
-        cc_agi = cd.agi_cap_bonus if cd else 0
-        cc_vit = cd.vit_cap_bonus if cd else 0
-        cc_int = cd.int_cap_bonus if cd else 0
-        cc_spi = cd.spi_cap_bonus if cd else 0
-        cc_wis = cd.wis_cap_bonus if cd else 0
-        cc_end = cd.end_cap_bonus if cd else 0
-        cc_per = cd.per_cap_bonus if cd else 0
-        cc_cha = cd.cha_cap_bonus if cd else 0
-        self._caps = AttributeCaps(
-            str_cap=15 + tier * 5 + cc_str, agi_cap=15 + tier * 5 + cc_agi,
-            vit_cap=15 + tier * 5 + cc_vit, int_cap=10 + tier * 3 + cc_int,
-            spi_cap=10 + tier * 3 + cc_spi, wis_cap=10 + tier * 3 + cc_wis,
-            end_cap=15 + tier * 5 + cc_end, per_cap=10 + tier * 3 + cc_per,
-            cha_cap=8 + tier * 2 + cc_cha,
+        self._attrs, self._caps = self._derive_mob_attributes(
+            attr_base, tier, (r_str, r_agi, r_vit, 0, r_spi, 0, 0, r_per, r_cha),
         )
         return self
 
+    def _derive_mob_attributes(
+        self, attr_base: int, tier: int, race_mods: tuple[int, ...],
+    ) -> tuple[Attributes, AttributeCaps]:
+        # Draws at tick+20..28 in order: str, agi, vit, int, wis, end, spi, per, cha
+        d_str, d_agi, d_vit, d_int, d_wis, d_end, d_spi, d_per, d_cha = (
+            self._rng.next_ints_bounded(
+                Domain.SPAWN, self._eid, self._tick + 20, _MOB_ATTR_HIGHS,
+            )
+        )
+        # Class bonuses (from with_mob_class or with_hero_class)
+        bonus = self._class_bonus
+        if bonus is not None:
+            cap_bonus = self._class_cap_bonus
+        else:
+            bonus = cap_bonus = _ZERO_ATTRS
+        attrs = _mob_attr_kernel(
+            attr_base, bonus, race_mods,
+            (d_str, d_agi, d_vit, d_int, d_spi, d_wis, d_end, d_per, d_cha),
+        )
+        return Attributes(*attrs), AttributeCaps(*_mob_cap_values(tier, cap_bonus))
+
     # -------------------------------------------------------------------
     # Skills
     # -------------------------------------------------------------------
 
     def with_race_skills(self, race: str) -> EntityBuilder:
         """Add skills from the race skill table."""
-        for sid in RACE_SKILLS.get(race, []):
-            if sid in SKILL_DEFS:
-                self._skills.append(SkillInstance(skill_id=sid))
+        self._skills.extend(map(SkillInstance, _race_skill_ids(race)))
         return self
 
     def with_class_skills(self, hero_class, level: int = 1) -> EntityBuilder:
         """Add class skills available at the given level."""
-        for sid in available_class_skills(hero_class, level):
-            self._skills.append(SkillInstance(skill_id=sid))
+        self._skills.extend(map(SkillInstance, available_class_skills(hero_class, level)))
         return self
 
     # -------------------------------------------------------------------
@@ -340,10 +377,15 @@ class EntityBuilder:
         return self
 
     def with_starting_items(self, item_ids: list[str]) -> EntityBuilder:
-        """Add starting items to inventory (must call with_inventory first)."""
-        if self._inventory:
-            for item_id in item_ids:
-                self._inventory.add_item(item_id)
+        """Add starting items to inventory (must call with_inventory first).
+
+        Runs of the same id are added in one bulk pass; bag order and the
+        limit checks follow *item_ids* exactly as repeated add_item() would.
+        """
+        inv = self._inventory
+        if inv:
+            for item_id, run in groupby(item_ids):
+                inv.add_items_bulk({item_id: sum(1 for _ in run)})
         return self
 
     def with_existing_inventory(self, inv: Inventory) -> EntityBuilder:
@@ -394,39 +436,35 @@ class EntityBuilder:
 
     def build(self) -> Entity:
         """Construct and return the final Entity."""
-        stamina = 30
-        if self._kind == "hero":
-            stamina = 50
+        kind = self._kind
+        stamina = _BASE_STAMINA.get(kind, _DEFAULT_BASE_STAMINA)
 
+        hp, atk, def_, spd, luck, crit_rate, crit_dmg, evasion, level, xp_to_next, gold = (
+            self._base
+        )
+        # Leading core-combat fields positionally (Stats field order:
+        # hp, max_hp, atk, def_, spd, luck, crit_rate, crit_dmg, evasion);
+        # fields after the elem_vuln factory stay keyword-only by convention.
         stats = Stats(
-            hp=self._base_hp,
-            max_hp=self._base_hp,
-            atk=self._base_atk,
-            def_=self._base_def,
-            spd=self._base_spd,
-            luck=self._luck,
-            crit_rate=self._crit_rate,
-            crit_dmg=self._crit_dmg,
-            evasion=self._evasion,
-            level=self._level,
-            xp=self._xp,
-            xp_to_next=self._xp_to_next,
-            gold=self._gold,
+            hp, hp, atk, def_, spd, luck, crit_rate, crit_dmg, evasion,
+            level=level,
+            xp_to_next=xp_to_next,
+            gold=gold,
             stamina=stamina,
             max_stamina=stamina,
         )
 
-        # Apply attribute-derived bonuses on top of base stats
-        if self._attrs:
-            recalc_derived_stats(stats, self._attrs)
-
-        # Set HP/stamina to max after derivation
-        stats.hp = stats.max_hp
-        stats.stamina = stats.max_stamina
+        # Apply attribute-derived bonuses on top of base stats, then refill
+        # HP/stamina to the derived maxima (already full when no attributes).
+        attrs = self._attrs
+        if attrs is not None:
+            recalc_derived_stats(stats, attrs)
+            stats.hp = stats.max_hp
+            stats.stamina = stats.max_stamina
 
         return Entity(
             id=self._eid,
-            kind=self._kind,
+            kind=kind,
             pos=self._pos,
             stats=stats,
             ai_state=self._ai_state,
@@ -437,7 +475,7 @@ class EntityBuilder:
             leash_radius=self._leash_radius,
             tier=self._tier,
             inventory=self._inventory,
-            attributes=self._attrs,
+            attributes=attrs,
             attribute_caps=self._caps,
             hero_class=self._hero_class or 0,
             skills=self._skills,
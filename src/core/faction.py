@@ -10,6 +10,8 @@ Design:
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import IntEnum, unique
 from typing import TYPE_CHECKING
@@ -53,6 +55,13 @@ class FactionRelation(IntEnum):
     HOSTILE = 2    # Attack on sight
 
 
+_FACTION_COUNT = max(Faction) + 1
+_MATERIAL_COUNT = max(Material) + 1
+_ALLIED = FactionRelation.ALLIED
+_NEUTRAL = FactionRelation.NEUTRAL
+_HOSTILE = FactionRelation.HOSTILE
+
+
 # ---------------------------------------------------------------------------
 # Territory descriptor
 # ---------------------------------------------------------------------------
@@ -84,89 +93,174 @@ class FactionRegistry:
         reg.owns_tile(Faction.HERO_GUILD, Material.TOWN)        # → True
     """
 
-    __slots__ = ("_relations", "_territories", "_kind_map")
+    __slots__ = (
+        "_relations", "_hostile_mask", "_allied_mask",
+        "_territories", "_tile_owner", "_home_tile", "_debuffs", "_kind_map",
+        "_read_only",
+    )
 
     def __init__(self) -> None:
-        # (faction_a, faction_b) → FactionRelation  (order-independent)
-        self._relations: dict[tuple[Faction, Faction], FactionRelation] = {}
+        # Dense matrix: _relations[a][b] → FactionRelation (symmetric).
+        # Faction ids are small ints, so two list indexes replace hashing an
+        # enum tuple; unset pairs are NEUTRAL and the diagonal is ALLIED.
+        self._relations: list[list[FactionRelation]] = [
+            [_ALLIED if a == b else _NEUTRAL for b in range(_FACTION_COUNT)]
+            for a in range(_FACTION_COUNT)
+        ]
+        # Faction id → per-faction bool rows derived from _relations, so a
+        # target scan fetches its row once and indexes it per candidate.
+        self._hostile_mask: list[tuple[bool, ...]] = []
+        self._allied_mask: list[tuple[bool, ...]] = []
+        self._rebuild_masks()
         # faction → TerritoryInfo
         self._territories: dict[Faction, TerritoryInfo] = {}
+        # Material id → owning faction (None if unclaimed)
+        self._tile_owner: list[Faction | None] = [None] * _MATERIAL_COUNT
+        # Faction id → its home tile (None if no territory)
+        self._home_tile: list[Material | None] = [None] * _FACTION_COUNT
+        # Faction id → (atk, def, spd, alert_radius) applied to intruders
+        self._debuffs: list[tuple[float, float, float, int] | None] = [None] * _FACTION_COUNT
         # entity kind string → faction
         self._kind_map: dict[str, Faction] = {}
+        # Set on the shared default() instance; builders then raise
+        self._read_only = False
 
     # -- builders --
 
+    def _check_writable(self) -> None:
+        if self._read_only:
+            raise TypeError(
+                "the shared default FactionRegistry is read-only; "
+                "use FactionRegistry.fresh_default() for a modifiable copy")
+
     def set_relation(self, a: Faction, b: Faction, rel: FactionRelation) -> None:
-        self._relations[(a, b)] = rel
-        self._relations[(b, a)] = rel
+        self._check_writable()
+        if a == b:
+            return  # a faction is always allied with itself
+        rel = FactionRelation(rel)
+        self._relations[a][b] = rel
+        self._relations[b][a] = rel
+        self._rebuild_masks()
+
+    def set_relation_block(self, factions: Iterable[Faction], rel: FactionRelation) -> None:
+        """Set *rel* between every pair of distinct factions in *factions*."""
+        self._check_writable()
+        rel = FactionRelation(rel)
+        ids = list(factions)
+        rows = self._relations
+        for a in ids:
+            row = rows[a]
+            for b in ids:
+                if a != b:
+                    row[b] = rel
+        self._rebuild_masks()
+
+    def _rebuild_masks(self) -> None:
+        rows = self._relations
+        self._hostile_mask = [tuple(r is _HOSTILE for r in row) for row in rows]
+        self._allied_mask = [tuple(r is _ALLIED for r in row) for row in rows]
 
     def set_territory(self, faction: Faction, info: TerritoryInfo) -> None:
+        self._check_writable()
         self._territories[faction] = info
+        self._home_tile[faction] = info.tile
+        self._debuffs[faction] = (
+            info.atk_debuff, info.def_debuff, info.spd_debuff, info.alert_radius,
+        )
+        # Rebuild the reverse index so the first-registered owner of a tile
+        # wins, as the old linear scan did (setup-time only, ~10 entries).
+        owners: list[Faction | None] = [None] * _MATERIAL_COUNT
+        for fac, t in self._territories.items():
+            if owners[t.tile] is None:
+                owners[t.tile] = fac
+        self._tile_owner = owners
 
     def register_kind(self, kind: str, faction: Faction) -> None:
-        self._kind_map[kind] = faction
+        # Interned keys: probes with interned kinds (EntityBuilder interns
+        # every entity kind) match by identity without comparing strings.
+        self._check_writable()
+        self._kind_map[sys.intern(kind)] = faction
 
     # -- queries --
 
     def relation(self, a: Faction, b: Faction) -> FactionRelation:
-        if a == b:
-            return FactionRelation.ALLIED
-        return self._relations.get((a, b), FactionRelation.NEUTRAL)
+        return self._relations[a][b]
 
     def is_hostile(self, a: Faction, b: Faction) -> bool:
-        return self.relation(a, b) == FactionRelation.HOSTILE
+        return self._relations[a][b] is _HOSTILE
 
     def is_allied(self, a: Faction, b: Faction) -> bool:
-        return self.relation(a, b) == FactionRelation.ALLIED
+        return self._relations[a][b] is _ALLIED
+
+    def hostile_mask(self, faction: Faction) -> tuple[bool, ...]:
+        """Return a tuple indexed by faction id: True where hostile to *faction*.
+
+        Batch form of ``is_hostile`` for scans over many candidates that
+        share one attacker: ``mask[other.faction]`` per candidate.
+        """
+        return self._hostile_mask[faction]
+
+    def allied_mask(self, faction: Faction) -> tuple[bool, ...]:
+        """Return a tuple indexed by faction id: True where allied with *faction*."""
+        return self._allied_mask[faction]
 
     def territory_for(self, faction: Faction) -> TerritoryInfo | None:
         return self._territories.get(faction)
 
+    def debuff_vectors_for(self, faction: Faction) -> tuple[float, float, float, int] | None:
+        """Return (atk_mult, def_mult, spd_mult, alert_radius) for intruders on
+        *faction*'s territory, or None if it has no territory."""
+        return self._debuffs[faction]
+
     def faction_for_kind(self, kind: str) -> Faction | None:
         return self._kind_map.get(kind)
 
     def owns_tile(self, faction: Faction, mat: Material) -> bool:
         """Return True if *mat* is this faction's home territory tile."""
-        info = self._territories.get(faction)
-        return info is not None and info.tile == mat
+        return self._home_tile[faction] == mat
 
     def tile_owner(self, mat: Material) -> Faction | None:
         """Return the faction that owns *mat*, or None."""
-        for fac, info in self._territories.items():
-            if info.tile == mat:
-                return fac
-        return None
+        return self._tile_owner[mat]
 
     def is_home_territory(self, faction: Faction, mat: Material) -> bool:
         """Check if *mat* is home territory for *faction*."""
-        return self.owns_tile(faction, mat)
+        return self._home_tile[faction] == mat
 
     def is_enemy_territory(self, faction: Faction, mat: Material) -> bool:
         """Check if *mat* is territory of a hostile faction."""
-        owner = self.tile_owner(mat)
-        if owner is None:
-            return False
-        return self.is_hostile(faction, owner)
+        owner = self._tile_owner[mat]
+        return owner is not None and self._relations[faction][owner] is _HOSTILE
 
     # -- factory --
 
     @classmethod
     def default(cls) -> FactionRegistry:
+        """Return the shared default registry, building it on first use.
+
+        The instance is shared by every caller and read-only: its builders
+        raise TypeError.  Use ``fresh_default()`` for a registry you intend
+        to modify.
+        """
+        global _DEFAULT
+        if _DEFAULT is None:
+            reg = cls._build_default()
+            reg._read_only = True
+            _DEFAULT = reg
+        return _DEFAULT
+
+    @classmethod
+    def fresh_default(cls) -> FactionRegistry:
+        """Build a new, unshared copy of the default registry."""
+        return cls._build_default()
+
+    @classmethod
+    def _build_default(cls) -> FactionRegistry:
         """Build the default registry with Hero Guild vs Goblin Horde."""
         reg = cls()
 
-        # --- Relations: hero vs all hostile; most factions hostile to each other ---
-        all_hostile = [
-            Faction.GOBLIN_HORDE, Faction.WOLF_PACK, Faction.BANDIT_CLAN,
-            Faction.UNDEAD, Faction.ORC_TRIBE, Faction.CENTAUR_HERD,
-            Faction.FROST_KIN, Faction.LIZARDFOLK, Faction.DEMON_HORDE,
-        ]
-        for fac in all_hostile:
-            reg.set_relation(Faction.HERO_GUILD, fac, FactionRelation.HOSTILE)
-        # Inter-faction hostility (everyone fights everyone)
-        for i, a in enumerate(all_hostile):
-            for b in all_hostile[i + 1:]:
-                reg.set_relation(a, b, FactionRelation.HOSTILE)
+        # --- Relations: hero vs all hostile; everyone fights everyone ---
+        reg.set_relation_block(Faction, FactionRelation.HOSTILE)
         # Exception: goblins and orcs are neutral
         reg.set_relation(Faction.GOBLIN_HORDE, Faction.ORC_TRIBE, FactionRelation.NEUTRAL)
 
@@ -253,3 +347,7 @@ class FactionRegistry:
         reg.register_kind("demon_lord", Faction.DEMON_HORDE)
 
         return reg
+
+
+# Lazily built by FactionRegistry.default()
+_DEFAULT: FactionRegistry | None = None
@@ -5,73 +5,80 @@ from __future__ import annotations
 from src.core.enums import Material
 from src.core.models import Vector2
 
+# Tile byte → Material member (Material values are dense from 0).
+_MATERIALS: tuple[Material, ...] = tuple(Material(i) for i in range(len(Material)))
+
+_WALL = int(Material.WALL)
+
+# Cap on memoized line-of-sight results per grid (cleared wholesale when hit)
+_LOS_CACHE_MAX = 65536
+
+# Per-material property bits, looked up by tile byte in _TILE_FLAGS
+TILE_WALKABLE = 1   # entities may stand on it
+TILE_OPAQUE = 2     # blocks line of sight and gives cover
+
+_NOT_WALKABLE = (Material.WALL, Material.WATER, Material.LAVA)
+_TILE_FLAGS = bytes(
+    (TILE_WALKABLE if i not in _NOT_WALKABLE else 0)
+    | (TILE_OPAQUE if i == Material.WALL else 0)
+    for i in range(256)
+)
+
+# bytes.translate table: opaque (WALL) → 1, every other material → 0
+_WALL_TO_ONE = bytes(1 if f & TILE_OPAQUE else 0 for f in _TILE_FLAGS)
+
 
 class Grid:
-    """2D tile grid backed by a flat list for cache-friendly access."""
+    """2D tile grid backed by a flat bytearray of Material values.
 
-    __slots__ = ("width", "height", "_tiles")
+    One byte per tile (vs. an 8-byte list slot) keeps large maps compact;
+    indexing ``_tiles`` yields plain ints, while ``get``/``get_xy`` still
+    return Material members.
+    """
+
+    __slots__ = ("width", "height", "_tiles", "_walkable", "_wall_adj", "_los_cache")
 
     def __init__(self, width: int, height: int, default: Material = Material.FLOOR) -> None:
         self.width = width
         self.height = height
-        self._tiles: list[Material] = [default] * (width * height)
+        self._tiles = bytearray([default]) * (width * height)
+        # 1 where walkable; kept in step with _tiles by set()
+        self._walkable = bytearray([_TILE_FLAGS[default] & TILE_WALKABLE]) * (width * height)
+        self._wall_adj: bytes | None = None  # cover mask, rebuilt lazily after set()
+        self._los_cache: dict[tuple[int, int, int, int], bool] = {}
 
     # -- access --
 
-    def _idx(self, x: int, y: int) -> int:
-        return y * self.width + x
-
     def in_bounds(self, pos: Vector2) -> bool:
         return 0 <= pos.x < self.width and 0 <= pos.y < self.height
 
     def get(self, pos: Vector2) -> Material:
-        if not self.in_bounds(pos):
-            return Material.WALL
-        return self._tiles[self._idx(pos.x, pos.y)]
+        x, y = pos.x, pos.y
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return _MATERIALS[self._tiles[y * self.width + x]]
+        return Material.WALL
 
     def set(self, pos: Vector2, material: Material) -> None:
-        if self.in_bounds(pos):
-            self._tiles[self._idx(pos.x, pos.y)] = material
+        x, y = pos.x, pos.y
+        if 0 <= x < self.width and 0 <= y < self.height:
+            i = y * self.width + x
+            self._tiles[i] = material
+            self._walkable[i] = _TILE_FLAGS[material] & TILE_WALKABLE
+            self._wall_adj = None
+            if self._los_cache:
+                self._los_cache.clear()
 
     def is_walkable(self, pos: Vector2) -> bool:
-        mat = self.get(pos)
-        return mat not in (Material.WALL, Material.WATER, Material.LAVA)
-
-    def is_forest(self, pos: Vector2) -> bool:
-        return self.get(pos) == Material.FOREST
-
-    def is_desert(self, pos: Vector2) -> bool:
-        return self.get(pos) == Material.DESERT
-
-    def is_swamp(self, pos: Vector2) -> bool:
-        return self.get(pos) == Material.SWAMP
-
-    def is_mountain(self, pos: Vector2) -> bool:
-        return self.get(pos) == Material.MOUNTAIN
-
-    def is_town(self, pos: Vector2) -> bool:
-        return self.get(pos) == Material.TOWN
+        return self.is_walkable_xy(pos.x, pos.y)
 
-    def is_camp(self, pos: Vector2) -> bool:
-        return self.get(pos) == Material.CAMP
+    def is_tile(self, pos: Vector2, material: Material) -> bool:
+        """True if the tile at *pos* is *material* (out of bounds reads as WALL)."""
+        return self.is_tile_xy(pos.x, pos.y, material)
 
-    def is_sanctuary(self, pos: Vector2) -> bool:
-        return self.get(pos) == Material.SANCTUARY
-
-    def is_road(self, pos: Vector2) -> bool:
-        return self.get(pos) == Material.ROAD
-
-    def is_bridge(self, pos: Vector2) -> bool:
-        return self.get(pos) == Material.BRIDGE
-
-    def is_ruins(self, pos: Vector2) -> bool:
-        return self.get(pos) == Material.RUINS
-
-    def is_dungeon_entrance(self, pos: Vector2) -> bool:
-        return self.get(pos) == Material.DUNGEON_ENTRANCE
-
-    def is_lava(self, pos: Vector2) -> bool:
-        return self.get(pos) == Material.LAVA
+    def count_tiles(self, flag: int) -> int:
+        """Count tiles whose material has any of the TILE_* bits in *flag*."""
+        table = bytes(1 if f & flag else 0 for f in _TILE_FLAGS)
+        return self._tiles.translate(table).count(1)
 
     # -- line-of-sight (Bresenham) --
 
@@ -80,16 +87,48 @@ class Grid:
 
         Uses Bresenham's line algorithm. Returns False if any WALL tile
         lies on the line between (x0,y0) and (x1,y1), exclusive of endpoints.
+        Results are memoized until the next ``set()``.
         """
+        key = (x0, y0, x1, y1)
+        cache = self._los_cache
+        hit = cache.get(key)
+        if hit is not None:
+            return hit
+        if len(cache) >= _LOS_CACHE_MAX:
+            cache.clear()
+        result = cache[key] = self._trace_line_of_sight(x0, y0, x1, y1)
+        return result
+
+    def _trace_line_of_sight(self, x0: int, y0: int, x1: int, y1: int) -> bool:
         dx = abs(x1 - x0)
         dy = abs(y1 - y0)
         sx = 1 if x0 < x1 else -1
         sy = 1 if y0 < y1 else -1
         err = dx - dy
+        # Locals + raw tile bytes: no get_xy call or enum compare per step
+        tiles = self._tiles
+        w = self.width
+        h = self.height
+        if 0 <= x0 < w and 0 <= y0 < h and 0 <= x1 < w and 0 <= y1 < h:
+            # Every step stays inside the endpoints' bounding box, so skip
+            # bounds checks and walk the flat index directly.
+            idx = y0 * w + x0
+            end = y1 * w + x1
+            step_y = sy * w
+            while True:
+                e2 = 2 * err
+                if e2 > -dy:
+                    err -= dy
+                    idx += sx
+                if e2 < dx:
+                    err += dx
+                    idx += step_y
+                if idx == end:
+                    return True
+                if tiles[idx] == _WALL:
+                    return False
         cx, cy = x0, y0
         while True:
-            if cx == x1 and cy == y1:
-                return True
             e2 = 2 * err
             if e2 > -dy:
                 err -= dy
@@ -97,13 +136,20 @@ class Grid:
             if e2 < dx:
                 err += dx
                 cy += sy
-            # Check intermediate tile (skip start and end)
-            if (cx != x1 or cy != y1) and self.get_xy(cx, cy) == Material.WALL:
+            if cx == x1 and cy == y1:
+                return True
+            # Intermediate tile; out of bounds reads as WALL like get_xy
+            if not (0 <= cx < w and 0 <= cy < h) or tiles[cy * w + cx] == _WALL:
                 return False
-        return True
 
     def has_adjacent_wall(self, x: int, y: int) -> bool:
         """Check if any of the 4 cardinal neighbors is a WALL tile (for cover)."""
+        w = self.width
+        if 0 <= x < w and 0 <= y < self.height:
+            mask = self._wall_adj
+            if mask is None:
+                mask = self._wall_adj = self.build_wall_adjacency_mask()
+            return mask[y * w + x] == 1
         return (
             self.get_xy(x - 1, y) == Material.WALL
             or self.get_xy(x + 1, y) == Material.WALL
@@ -111,14 +157,45 @@ class Grid:
             or self.get_xy(x, y + 1) == Material.WALL
         )
 
+    def build_wall_adjacency_mask(self) -> bytes:
+        """Return one byte per tile: 1 if a cardinal neighbor is WALL, else 0.
+
+        The wall map is packed into one big int (a byte per tile) and OR-ed
+        with copies shifted by one tile and one row, so the whole grid is
+        processed in a few C-level passes. Shifts wrap across row ends, but
+        those tiles sit on the left/right edge, where the out-of-bounds
+        neighbor already counts as WALL.
+        """
+        w, h = self.width, self.height
+        n = w * h
+        if n == 0:
+            return b""
+        walls = int.from_bytes(self._tiles.translate(_WALL_TO_ONE), "little")
+        adj = (walls << 8) | (walls >> 8) | (walls << 8 * w) | (walls >> 8 * w)
+        mask = bytearray((adj & ((1 << 8 * n) - 1)).to_bytes(n, "little"))
+        # Edge tiles border out-of-bounds, which reads as WALL
+        mask[:w] = mask[n - w:] = b"\x01" * w
+        mask[::w] = mask[w - 1::w] = b"\x01" * h
+        return bytes(mask)
+
     # -- fast raw-coordinate access (no Vector2 alloc, for hot loops) --
 
     def in_bounds_xy(self, x: int, y: int) -> bool:
         return 0 <= x < self.width and 0 <= y < self.height
 
+    def is_walkable_xy(self, x: int, y: int) -> bool:
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self._walkable[y * self.width + x] == 1
+        return False  # out of bounds reads as WALL
+
+    def is_tile_xy(self, x: int, y: int, material: Material) -> bool:
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self._tiles[y * self.width + x] == material
+        return material == Material.WALL
+
     def get_xy(self, x: int, y: int) -> Material:
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self._tiles[y * self.width + x]
+            return _MATERIALS[self._tiles[y * self.width + x]]
         return Material.WALL
 
     # -- copy --
@@ -127,5 +204,8 @@ class Grid:
         new = Grid.__new__(Grid)
         new.width = self.width
         new.height = self.height
-        new._tiles = list(self._tiles)
+        new._tiles = bytearray(self._tiles)
+        new._walkable = bytearray(self._walkable)
+        new._wall_adj = self._wall_adj  # immutable bytes, safe to share
+        new._los_cache = {}
         return new
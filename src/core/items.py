@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Annotated, TYPE_CHECKING
 
 from pydantic import PlainSerializer
@@ -61,11 +64,41 @@ class ItemTemplate:
 # Item registry — all item definitions live here
 # ---------------------------------------------------------------------------
 
-ITEM_REGISTRY: dict[str, ItemTemplate] = {}
+# Written only by _reg(); everything else sees the read-only views below.
+# Code in this module reads the backing dicts directly to skip the proxy hop.
+_ITEM_REGISTRY: dict[str, ItemTemplate] = {}
+# item_id → _item_power(template), kept in step with _ITEM_REGISTRY by _reg()
+_ITEM_POWER: dict[str, int] = {}
+
+ITEM_REGISTRY: Mapping[str, ItemTemplate] = MappingProxyType(_ITEM_REGISTRY)
+ITEM_POWER: Mapping[str, int] = MappingProxyType(_ITEM_POWER)
+
+# Equipment bonus fields summed by Inventory.equipment_bonus()
+_BONUS_FIELDS = (
+    "atk_bonus", "def_bonus", "spd_bonus", "max_hp_bonus",
+    "crit_rate_bonus", "evasion_bonus", "luck_bonus", "matk_bonus", "mdef_bonus",
+)
+# bonus field → item_id → value, so equipment_bonus() skips getattr per slot
+_STAT_BONUS: dict[str, dict[str, int | float]] = {f: {} for f in _BONUS_FIELDS}
+
+
+def _item_power(t: ItemTemplate) -> int:
+    """Simple heuristic for item power (sum of all stat bonuses)."""
+    return (t.atk_bonus + t.def_bonus + t.spd_bonus + t.max_hp_bonus
+            + t.matk_bonus + t.mdef_bonus
+            + int(t.crit_rate_bonus * 50) + int(t.evasion_bonus * 50)
+            + t.luck_bonus)
 
 
 def _reg(t: ItemTemplate) -> ItemTemplate:
-    ITEM_REGISTRY[t.item_id] = t
+    # Intern the id so registry probes and Inventory count lookups hit
+    # CPython's identity fast path even for templates built at runtime.
+    iid = sys.intern(t.item_id)
+    object.__setattr__(t, "item_id", iid)
+    _ITEM_REGISTRY[iid] = t
+    _ITEM_POWER[iid] = _item_power(t)
+    for f, table in _STAT_BONUS.items():
+        table[iid] = getattr(t, f)
     return t
 
 
@@ -194,30 +227,37 @@ _reg(ItemTemplate("camp_treasure",     "Camp Treasure Chest", ItemType.CONSUMABL
 
 
 def get_item(item_id: str) -> ItemTemplate | None:
-    return ITEM_REGISTRY.get(item_id)
-
-
-def _item_power(t: ItemTemplate) -> int:
-    """Simple heuristic for item power (sum of all stat bonuses)."""
-    return (t.atk_bonus + t.def_bonus + t.spd_bonus + t.max_hp_bonus
-            + t.matk_bonus + t.mdef_bonus
-            + int(t.crit_rate_bonus * 50) + int(t.evasion_bonus * 50)
-            + t.luck_bonus)
+    return _ITEM_REGISTRY.get(item_id)
 
 
 def item_power(item_id: str) -> int:
     """Public wrapper: returns item power score for an item_id."""
-    t = ITEM_REGISTRY.get(item_id)
-    return _item_power(t) if t else 0
+    return _ITEM_POWER.get(item_id, 0)
 
 
 # ---------------------------------------------------------------------------
 # Inventory — mutable container held by each entity
 # ---------------------------------------------------------------------------
 
+# Equippable ItemType → Inventory slot attribute
+_SLOT_ATTR: dict[int, str] = {
+    ItemType.WEAPON: "weapon",
+    ItemType.ARMOR: "armor",
+    ItemType.ACCESSORY: "accessory",
+}
+
+# Item types that occupy an equipment slot
+EQUIPPABLE_TYPES: frozenset[int] = frozenset(_SLOT_ATTR)
+
+
 @dataclass(slots=True)
 class Inventory:
-    """Mutable item container with slot and weight limits."""
+    """Mutable item container with slot and weight limits.
+
+    ``items`` keeps bag order (loot drops and sell/store passes walk it in
+    order); ``_counts`` is a multiset index over it for O(1) count and
+    membership checks.  Mutate the bag only through the methods below.
+    """
 
     items: list[str] = field(default_factory=list)  # list of item_ids
     max_slots: int = 8
@@ -226,19 +266,76 @@ class Inventory:
     weapon: str | None = None
     armor: str | None = None
     accessory: str | None = None
-
-    @property
-    def current_weight(self) -> float:
-        total = 0.0
+    # item_id → copies in items (only ids with a nonzero count)
+    _counts: dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Sum of bag item weights in bag order; None = recompute on next read
+    _bag_weight: float | None = field(default=None, init=False, repr=False, compare=False)
+    # (weapon, armor, accessory) the bonus totals and weights below are for
+    _equip_key: tuple[str | None, str | None, str | None] | None = field(
+        default=None, init=False, repr=False, compare=False)
+    # bonus field → summed bonus over the equipped slots in _equip_key
+    _equipped_totals: dict[str, int | float] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    # Weights of the occupied slots in _equip_key, in slot order
+    _equip_weights: tuple[float, ...] = field(
+        default=(), init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        counts = self._counts
         for iid in self.items:
-            t = ITEM_REGISTRY.get(iid)
+            counts[iid] = counts.get(iid, 0) + 1
+
+    def _push(self, item_id: str) -> None:
+        self.items.append(item_id)
+        counts = self._counts
+        counts[item_id] = counts.get(item_id, 0) + 1
+        # Appending extends the in-order sum exactly, so the cache stays valid.
+        if self._bag_weight is not None:
+            t = _ITEM_REGISTRY.get(item_id)
             if t:
-                total += t.weight
-        for slot_id in (self.weapon, self.armor, self.accessory):
-            if slot_id:
-                t = ITEM_REGISTRY.get(slot_id)
+                self._bag_weight += t.weight
+
+    def _pop(self, item_id: str) -> None:
+        self.items.remove(item_id)
+        counts = self._counts
+        n = counts[item_id] - 1
+        if n:
+            counts[item_id] = n
+        else:
+            del counts[item_id]
+        self._bag_weight = None
+
+    def _get_bag_weight(self) -> float:
+        total = self._bag_weight
+        if total is None:
+            total = 0.0
+            for iid in self.items:
+                t = _ITEM_REGISTRY.get(iid)
                 if t:
                     total += t.weight
+            self._bag_weight = total
+        return total
+
+    def _slot_weights(self) -> tuple[float, ...]:
+        w, a, c = self.weapon, self.armor, self.accessory
+        key = self._equip_key
+        if key is None or key[0] is not w or key[1] is not a or key[2] is not c:
+            self._recalc_equipped((w, a, c))
+        return self._equip_weights
+
+    @property
+    def current_weight(self) -> float:
+        total = self._bag_weight
+        if total is None:
+            total = self._get_bag_weight()
+        w, a, c = self.weapon, self.armor, self.accessory
+        key = self._equip_key
+        if key is None or key[0] is not w or key[1] is not a or key[2] is not c:
+            self._recalc_equipped((w, a, c))
+        # Add slot weights one by one (not pre-summed) so the float result
+        # matches a plain bag-then-slots walk exactly.
+        for sw in self._equip_weights:
+            total += sw
         return total
 
     @property
@@ -257,7 +354,7 @@ class Inventory:
     def can_add(self, item_id: str) -> bool:
         if self.used_slots >= self.max_slots:
             return False
-        t = ITEM_REGISTRY.get(item_id)
+        t = _ITEM_REGISTRY.get(item_id)
         if t is None:
             return False
         return self.current_weight + t.weight <= self.max_weight
@@ -265,41 +362,75 @@ class Inventory:
     def add_item(self, item_id: str) -> bool:
         if not self.can_add(item_id):
             return False
-        self.items.append(item_id)
+        self._push(item_id)
         return True
 
+    def add_items_bulk(self, counts: Mapping[str, int]) -> int:
+        """Add ``counts[item_id]`` copies of each item; return how many fit.
+
+        Applies the same slot and weight limits as add_item(), but computes
+        the current weight once instead of once per added item.
+        """
+        free = self.max_slots - len(self.items)
+        max_weight = self.max_weight
+        # Accumulate in the same order as current_weight (bag items, then
+        # equipped slots) so the limit check matches add_item() bit for bit.
+        bag_weight = self._get_bag_weight()
+        equip_weights = self._slot_weights()
+        added = 0
+        for item_id, n in counts.items():
+            t = _ITEM_REGISTRY.get(item_id)
+            if t is None:
+                continue
+            w = t.weight
+            while n > 0 and free > 0:
+                total = bag_weight
+                for ew in equip_weights:
+                    total += ew
+                if total + w > max_weight:
+                    break
+                self._push(item_id)
+                bag_weight += w
+                free -= 1
+                n -= 1
+                added += 1
+        return added
+
     def remove_item(self, item_id: str) -> bool:
-        if item_id in self.items:
-            self.items.remove(item_id)
+        if item_id in self._counts:
+            self._pop(item_id)
             return True
         return False
 
+    def clear_items(self) -> None:
+        """Drop every bag item; equipped items are kept."""
+        self.items.clear()
+        self._counts.clear()
+        self._bag_weight = 0.0
+
     def has_consumable(self, item_id: str) -> bool:
-        return item_id in self.items
+        return item_id in self._counts
 
     def count_item(self, item_id: str) -> int:
-        return self.items.count(item_id)
+        return self._counts.get(item_id, 0)
 
     def equip(self, item_id: str) -> bool:
         """Equip an item from inventory into the appropriate slot."""
-        t = ITEM_REGISTRY.get(item_id)
-        if t is None or item_id not in self.items:
+        t = _ITEM_REGISTRY.get(item_id)
+        if t is None or item_id not in self._counts:
             return False
-        if t.item_type == ItemType.WEAPON:
-            if self.weapon:
-                self.items.append(self.weapon)
-            self.weapon = item_id
-        elif t.item_type == ItemType.ARMOR:
-            if self.armor:
-                self.items.append(self.armor)
-            self.armor = item_id
-        elif t.item_type == ItemType.ACCESSORY:
-            if self.accessory:
-                self.items.append(self.accessory)
-            self.accessory = item_id
-        else:
+        return self._equip_template(item_id, t)
+
+    def _equip_template(self, item_id: str, t: ItemTemplate) -> bool:
+        """Move bagged *item_id* (template *t*, already resolved) into its slot."""
+        slot = _SLOT_ATTR.get(t.item_type)
+        if slot is None:
             return False
-        self.items.remove(item_id)
+        current = getattr(self, slot)
+        if current:
+            self._push(current)
+        setattr(self, slot, item_id)
+        self._pop(item_id)
         return True
 
     def auto_equip_best(self, item_id: str) -> bool:
@@ -309,43 +440,73 @@ class Inventory:
         (sum of all stat bonuses) and only equip if the new item is stronger.
         Returns True if the item was equipped.
         """
-        t = ITEM_REGISTRY.get(item_id)
-        if t is None or item_id not in self.items:
+        t = _ITEM_REGISTRY.get(item_id)
+        if t is None or item_id not in self._counts:
             return False
-        if t.item_type not in (ItemType.WEAPON, ItemType.ARMOR, ItemType.ACCESSORY):
+        slot = _SLOT_ATTR.get(t.item_type)
+        if slot is None:
             return False
 
         # Determine current equipped item for this slot
-        if t.item_type == ItemType.WEAPON:
-            current_id = self.weapon
-        elif t.item_type == ItemType.ARMOR:
-            current_id = self.armor
-        else:
-            current_id = self.accessory
+        current_id = getattr(self, slot)
 
         if current_id is None:
             # Slot empty — always equip
-            return self.equip(item_id)
+            return self._equip_template(item_id, t)
 
-        current_t = ITEM_REGISTRY.get(current_id)
-        if current_t is None:
-            return self.equip(item_id)
+        current_power = _ITEM_POWER.get(current_id)
+        if current_power is None:
+            return self._equip_template(item_id, t)
 
         # Compare item power (sum of all stat bonuses)
-        if _item_power(t) > _item_power(current_t):
-            return self.equip(item_id)
+        if _ITEM_POWER[item_id] > current_power:
+            return self._equip_template(item_id, t)
         return False
 
     def equipment_bonus(self, stat: str) -> int | float:
         """Sum a stat bonus across all equipped items."""
+        # Slots may be assigned directly (EntityBuilder, tests), so the
+        # cached totals are validated against the current slot ids.
+        w, a, c = self.weapon, self.armor, self.accessory
+        key = self._equip_key
+        if key is None or key[0] is not w or key[1] is not a or key[2] is not c:
+            totals = self._recalc_equipped((w, a, c))
+        else:
+            totals = self._equipped_totals
+        try:
+            return totals[stat]
+        except KeyError:
+            pass  # not a bonus field (e.g. "weight"): sum it generically
         total: int | float = 0
         for slot_id in (self.weapon, self.armor, self.accessory):
             if slot_id:
-                t = ITEM_REGISTRY.get(slot_id)
+                t = _ITEM_REGISTRY.get(slot_id)
                 if t:
                     total += getattr(t, stat, 0)
         return total
 
+    def _recalc_equipped(
+        self, key: tuple[str | None, str | None, str | None],
+    ) -> dict[str, int | float]:
+        totals: dict[str, int | float] = {}
+        for f, table in _STAT_BONUS.items():
+            # Same slot order as the generic loop, so float sums match.
+            total: int | float = 0
+            for slot_id in key:
+                if slot_id:
+                    total += table.get(slot_id, 0)
+            totals[f] = total
+        weights = []
+        for slot_id in key:
+            if slot_id:
+                t = _ITEM_REGISTRY.get(slot_id)
+                if t:
+                    weights.append(t.weight)
+        self._equip_key = key
+        self._equipped_totals = totals
+        self._equip_weights = tuple(weights)
+        return totals
+
     def get_all_item_ids(self) -> list[str]:
         """Return all item_ids (inventory + equipped) — used for loot drops."""
         result = list(self.items)
@@ -357,15 +518,24 @@ class Inventory:
             result.append(self.accessory)
         return result
 
-    def copy(self) -> Inventory:
-        return Inventory(
-            items=list(self.items),
-            max_slots=self.max_slots,
-            max_weight=self.max_weight,
-            weapon=self.weapon,
-            armor=self.armor,
-            accessory=self.accessory,
-        )
+    def __copy__(self) -> Inventory:
+        # Bypass __init__/__post_init__ and write slots directly
+        new = Inventory.__new__(Inventory)
+        new.items = self.items.copy()
+        new.max_slots = self.max_slots
+        new.max_weight = self.max_weight
+        new.weapon = self.weapon
+        new.armor = self.armor
+        new.accessory = self.accessory
+        new._counts = self._counts.copy()
+        new._bag_weight = self._bag_weight
+        # Totals dicts are replaced, never mutated, so sharing is safe.
+        new._equip_key = self._equip_key
+        new._equipped_totals = self._equipped_totals
+        new._equip_weights = self._equip_weights
+        return new
+
+    copy = __copy__
 
 
 # ---------------------------------------------------------------------------
@@ -427,12 +597,15 @@ class HomeStorage:
         self.level = next_level
         return True
 
-    def copy(self) -> HomeStorage:
-        return HomeStorage(
-            items=list(self.items),
-            max_slots=self.max_slots,
-            level=self.level,
-        )
+    def __copy__(self) -> HomeStorage:
+        # Bypass the generated __init__ and write slots directly
+        new = HomeStorage.__new__(HomeStorage)
+        new.items = self.items.copy()
+        new.max_slots = self.max_slots
+        new.level = self.level
+        return new
+
+    copy = __copy__
 
 
 # ---------------------------------------------------------------------------
@@ -693,6 +866,31 @@ RACE_STARTING_GEAR: dict[str, dict[int, dict[str, str | None]]] = {
     },
 }
 
+# (weapon, armor, accessory) views of the starting-gear tables for spawning.
+# Ids missing from the registry are dropped here, once, instead of being
+# checked slot by slot on every spawn.
+GearSlots = tuple[str | None, str | None, str | None]
+
+NO_GEAR: GearSlots = (None, None, None)
+
+
+def _gear_slots(gear: dict[str, str | None]) -> GearSlots:
+    w, a, c = (gear.get(slot) for slot in ("weapon", "armor", "accessory"))
+    return (
+        w if w in _ITEM_REGISTRY else None,
+        a if a in _ITEM_REGISTRY else None,
+        c if c in _ITEM_REGISTRY else None,
+    )
+
+
+TIER_GEAR_SLOTS: dict[int, GearSlots] = {
+    tier: _gear_slots(gear) for tier, gear in TIER_STARTING_GEAR.items()
+}
+RACE_GEAR_SLOTS: dict[str, dict[int, GearSlots]] = {
+    race: {tier: _gear_slots(gear) for tier, gear in tiers.items()}
+    for race, tiers in RACE_STARTING_GEAR.items()
+}
+
 # Stat adjustments per race (hp_mult, atk_mult, def_mod, spd_mod, crit, evasion, luck)
 RACE_STAT_MODS: dict[str, tuple[float, float, int, int, float, float, int]] = {
     "wolf":    (0.8,  1.1, -1, 3,  0.08, 0.06, 1),  # fast, fragile, high crit
@@ -743,9 +941,18 @@ class TreasureChest:
     pos: Vector2
     tier: int = 1                  # 1=common, 2=rare, 3=legendary
     looted: bool = False
-    respawn_at: int = -1           # Tick when chest respawns (-1 = available)
+    respawn_at: int = sys.maxsize  # Tick when chest respawns (sys.maxsize = available)
     guard_entity_id: int | None = None  # Entity ID of the elite guard
 
+    def __post_init__(self) -> None:
+        # Keep respawn_at consistent with looted so try_respawn's single
+        # compare holds: an available chest never respawns, and a chest
+        # built as looted without a timer respawns on the next check.
+        if not self.looted:
+            self.respawn_at = sys.maxsize
+        elif self.respawn_at == sys.maxsize:
+            self.respawn_at = 0
+
     @property
     def is_available(self) -> bool:
         return not self.looted
@@ -757,21 +964,26 @@ class TreasureChest:
 
     def try_respawn(self, current_tick: int) -> bool:
         """Check if chest should respawn. Returns True if respawned."""
-        if self.looted and current_tick >= self.respawn_at:
-            self.looted = False
-            self.respawn_at = -1
-            return True
-        return False
+        # respawn_at is sys.maxsize while the chest is available, so a
+        # single compare covers both the looted and the timer check.
+        if current_tick < self.respawn_at:
+            return False
+        self.looted = False
+        self.respawn_at = sys.maxsize
+        return True
+
+    def __copy__(self) -> TreasureChest:
+        # Bypass the generated __init__ and write slots directly
+        new = TreasureChest.__new__(TreasureChest)
+        new.chest_id = self.chest_id
+        new.pos = self.pos
+        new.tier = self.tier
+        new.looted = self.looted
+        new.respawn_at = self.respawn_at
+        new.guard_entity_id = self.guard_entity_id
+        return new
 
-    def copy(self) -> TreasureChest:
-        return TreasureChest(
-            chest_id=self.chest_id,
-            pos=self.pos,
-            tier=self.tier,
-            looted=self.looted,
-            respawn_at=self.respawn_at,
-            guard_entity_id=self.guard_entity_id,
-        )
+    copy = __copy__
 
 
 # Chest loot tables per tier: (item_id, drop_chance, min_count, max_count)
@@ -860,3 +1072,46 @@ DIFFICULTY_BONUS_LOOT: dict[int, list[tuple[str, float]]] = {
         ("crown_of_ruin", 0.02),
     ],
 }
+
+
+# ---------------------------------------------------------------------------
+# Column views of the (item_id, drop_chance) tables for spawn-time rolls
+# ---------------------------------------------------------------------------
+
+# (item_ids, drop_chances, roll_salts) — parallel tuples, one entry per row
+LootColumns = tuple[tuple[str, ...], tuple[float, ...], tuple[int, ...]]
+
+EMPTY_LOOT_COLUMNS: LootColumns = ((), (), ())
+
+
+def _loot_columns(table: list[tuple[str, float]]) -> LootColumns:
+    """Split a drop table into parallel columns.
+
+    The salt column holds ``hash(item_id) % 100``, the per-item tick offset
+    the loot rolls use; str hashes are fixed for the life of the process,
+    so precomputing it here leaves every roll unchanged.
+    """
+    ids = tuple(item_id for item_id, _ in table)
+    chances = tuple(chance for _, chance in table)
+    return ids, chances, tuple(hash(item_id) % 100 for item_id in ids)
+
+
+LOOT_COLUMNS: dict[int, LootColumns] = {
+    tier: _loot_columns(table) for tier, table in LOOT_TABLES.items()
+}
+RACE_LOOT_COLUMNS: dict[str, LootColumns] = {
+    kind: _loot_columns(table) for kind, table in RACE_LOOT_TABLES.items()
+}
+DIFFICULTY_BONUS_LOOT_COLUMNS: dict[int, LootColumns] = {
+    tier: _loot_columns(table) for tier, table in DIFFICULTY_BONUS_LOOT.items()
+}
+
+# (item_ids, drop_chances, min_counts, max_counts) — parallel tuples
+ChestLootColumns = tuple[tuple[str, ...], tuple[float, ...], tuple[int, ...], tuple[int, ...]]
+
+EMPTY_CHEST_LOOT_COLUMNS: ChestLootColumns = ((), (), (), ())
+
+CHEST_LOOT_COLUMNS: dict[int, ChestLootColumns] = {
+    tier: tuple(tuple(col) for col in zip(*table)) if table else EMPTY_CHEST_LOOT_COLUMNS
+    for tier, table in CHEST_LOOT_TABLES.items()
+}
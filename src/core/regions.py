@@ -274,7 +274,7 @@ TERRAIN_RACE_LABEL: dict[int, str] = {
 # Difficulty multiplier tables
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DifficultyMultipliers:
     """Stat multipliers for a given difficulty tier."""
     hp: float
@@ -16,6 +16,7 @@ Key types:
 from __future__ import annotations
 
 from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from pydantic.dataclasses import dataclass as pydantic_dataclass
@@ -277,6 +278,19 @@ RACE_TRAIT_BIAS: dict[str, list[tuple[int, float]]] = {
 ALL_TRAIT_TYPES: list[int] = [t.value for t in TraitType]
 
 
+@lru_cache(maxsize=None)
+def _trait_pool(race_prefix: str) -> tuple[tuple[int, float], ...]:
+    """(trait, weight) pairs in ALL_TRAIT_TYPES order, with race bias applied."""
+    base_weight = 1.0
+    weight_map: dict[int, float] = {t: base_weight for t in ALL_TRAIT_TYPES}
+    for prefix, biases in RACE_TRAIT_BIAS.items():
+        if race_prefix.startswith(prefix):
+            for trait_type, weight in biases:
+                weight_map[trait_type] = weight
+            break
+    return tuple((t, weight_map[t]) for t in ALL_TRAIT_TYPES)
+
+
 def assign_traits(
     rng: DeterministicRNG,
     domain_id: int,
@@ -289,33 +303,19 @@ def assign_traits(
     """Randomly assign traits to an entity, respecting incompatibility.
 
     Uses weighted selection biased by race.  Returns a list of TraitType
-    int values.
+    int values.  The weighted pool is built once per race prefix.
     """
-    from src.core.enums import Domain
-
     # Determine how many traits
     num_traits = rng.next_int(domain_id, entity_id, tick + 100, count_min, count_max)
 
-    # Build weighted pool
-    base_weight = 1.0
-    weight_map: dict[int, float] = {t: base_weight for t in ALL_TRAIT_TYPES}
-    # Apply race bias
-    for prefix, biases in RACE_TRAIT_BIAS.items():
-        if race_prefix.startswith(prefix):
-            for trait_type, weight in biases:
-                weight_map[trait_type] = weight
-            break
-
     chosen: list[int] = []
-    available = list(ALL_TRAIT_TYPES)
+    available = list(_trait_pool(race_prefix))
 
     for i in range(num_traits):
         if not available:
             break
 
-        # Compute cumulative weights for available traits
-        weights = [weight_map.get(t, base_weight) for t in available]
-        total = sum(weights)
+        total = sum(w for _, w in available)
         if total <= 0:
             break
 
@@ -323,19 +323,19 @@ def assign_traits(
         roll = rng.next_float(domain_id, entity_id, tick + 200 + i) * total
         cumulative = 0.0
         selected_idx = 0
-        for idx, w in enumerate(weights):
+        for idx, (_, w) in enumerate(available):
             cumulative += w
             if roll <= cumulative:
                 selected_idx = idx
                 break
 
-        selected = available[selected_idx]
+        selected = available[selected_idx][0]
         chosen.append(selected)
 
         # Remove selected and all incompatible traits from pool
         available = [
-            t for t in available
-            if t != selected and are_compatible(t, selected)
+            entry for entry in available
+            if entry[0] != selected and (entry[0], selected) not in _INCOMPAT_SET
         ]
 
     return chosen
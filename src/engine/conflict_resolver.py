@@ -58,7 +58,7 @@ class ConflictResolver:
         def sort_key(p: ActionProposal) -> tuple[int, float, int]:
             entity = world.entities.get(p.actor_id)
             next_act = entity.next_act_at if entity else float("inf")
-            return (p.verb.value, next_act, p.actor_id)
+            return (p.verb, next_act, p.actor_id)  # IntEnum compares as int
 
         return sorted(proposals, key=sort_key)
 
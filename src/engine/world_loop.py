@@ -14,7 +14,7 @@ import time
 from typing import TYPE_CHECKING
 
 from src.core.effects import EffectType, territory_debuff
-from src.core.enums import AIState, ActionType, Domain
+from src.core.enums import AIState, ActionType, Domain, Material
 from src.core.faction import Faction, FactionRegistry
 from src.core.items import ITEM_REGISTRY
 from src.core.snapshot import Snapshot
@@ -32,6 +32,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Faction id → territory debuff source label
+_TERRITORY_SOURCE: tuple[str, ...] = tuple(f"{f.name}_territory" for f in Faction)
+
 
 class WorldLoop:
     """The heartbeat of the simulation.
@@ -306,8 +309,8 @@ class WorldLoop:
             if not entity.alive or entity.kind == "generator":
                 continue
 
-            on_town = self._world.grid.is_town(entity.pos)
-            on_camp = self._world.grid.is_camp(entity.pos)
+            on_town = self._world.grid.is_tile(entity.pos, Material.TOWN)
+            on_camp = self._world.grid.is_tile(entity.pos, Material.CAMP)
 
             # --- Town aura: hostile entities in town take gradual damage ---
             if on_town and reg.is_hostile(entity.faction, Faction.HERO_GUILD):
@@ -438,8 +441,8 @@ class WorldLoop:
 
             elif proposal.verb == ActionType.USE_SKILL and proposal.target:
                 # Use a skill on a target
-                from src.core.classes import SKILL_DEFS, SkillTarget
-                from src.core.effects import skill_effect
+                from src.core.classes import SKILL_DEFS, SKILL_EFFECT_MULTS, SkillTarget
+                from src.core.effects import skill_effect_from_mults
                 from src.actions.damage import get_damage_calculator
                 skill_id: str = proposal.target if isinstance(proposal.target, str) else ""
                 # Find the skill instance on the entity
@@ -451,15 +454,14 @@ class WorldLoop:
                 if skill_inst and skill_inst.is_ready():
                     sdef = SKILL_DEFS.get(skill_id)
                     if sdef:
-                        stamina_cost = skill_inst.effective_stamina_cost(sdef.stamina_cost)
+                        stamina_cost, cooldown = skill_inst.costs(sdef)
                         if entity.stats.stamina >= stamina_cost:
                             entity.stats.stamina -= stamina_cost
-                            cooldown = skill_inst.effective_cooldown(sdef.cooldown)
                             skill_inst.use(base_cooldown=cooldown)
                             power = skill_inst.effective_power(sdef.power)
                             skill_range = getattr(sdef, 'range', 1) or 1
-                            has_mods = any([sdef.atk_mod, sdef.def_mod, sdef.spd_mod,
-                                            sdef.crit_mod, sdef.evasion_mod])
+                            effect_mults = SKILL_EFFECT_MULTS.get(skill_id)
+                            has_mods = effect_mults is not None
 
                             if sdef.target in (SkillTarget.SINGLE_ENEMY, SkillTarget.AREA_ENEMIES):
                                 # Resolve damage via DamageCalculator (design-01)
@@ -568,12 +570,8 @@ class WorldLoop:
                                                              "target_max_hp": other.stats.max_hp})
                                     # Apply debuff if skill has duration + mods
                                     if sdef.duration > 0 and has_mods:
-                                        other.effects.append(skill_effect(
-                                            atk_mod=sdef.atk_mod, def_mod=sdef.def_mod,
-                                            spd_mod=sdef.spd_mod, crit_mod=sdef.crit_mod,
-                                            evasion_mod=sdef.evasion_mod,
-                                            duration=sdef.duration, source=sdef.name,
-                                            is_debuff=True,
+                                        other.effects.append(skill_effect_from_mults(
+                                            effect_mults, sdef.duration, sdef.name, is_debuff=True,
                                         ))
                                         logger.info(
                                             "Tick %d: Entity %d debuffed by %s for %d ticks",
@@ -594,11 +592,8 @@ class WorldLoop:
                                     )
                                 # Apply self-buff if skill has duration + mods
                                 if sdef.duration > 0 and has_mods:
-                                    entity.effects.append(skill_effect(
-                                        atk_mod=sdef.atk_mod, def_mod=sdef.def_mod,
-                                        spd_mod=sdef.spd_mod, crit_mod=sdef.crit_mod,
-                                        evasion_mod=sdef.evasion_mod,
-                                        duration=sdef.duration, source=sdef.name,
+                                    entity.effects.append(skill_effect_from_mults(
+                                        effect_mults, sdef.duration, sdef.name,
                                     ))
                                     logger.info(
                                         "Tick %d: Entity %d buffed by %s for %d ticks",
@@ -615,11 +610,8 @@ class WorldLoop:
                                     if other.faction != entity.faction:
                                         continue
                                     if sdef.duration > 0 and has_mods:
-                                        other.effects.append(skill_effect(
-                                            atk_mod=sdef.atk_mod, def_mod=sdef.def_mod,
-                                            spd_mod=sdef.spd_mod, crit_mod=sdef.crit_mod,
-                                            evasion_mod=sdef.evasion_mod,
-                                            duration=sdef.duration, source=sdef.name,
+                                        other.effects.append(skill_effect_from_mults(
+                                            effect_mults, sdef.duration, sdef.name,
                                         ))
                                 logger.info(
                                     "Tick %d: Entity %d used %s (allies) in range %d",
@@ -727,9 +719,11 @@ class WorldLoop:
             else:
                 regen = 1
             entity.stats.stamina = min(entity.stats.stamina + regen, entity.stats.max_stamina)
-            # Tick skill cooldowns
+            # Tick skill cooldowns inline (same as SkillInstance.tick, no call per skill)
             for skill in entity.skills:
-                skill.tick()
+                cd = skill.cooldown_remaining
+                if cd > 0:
+                    skill.cooldown_remaining = cd - 1
 
     def _update_entity_memory(self) -> None:
         """Update terrain_memory and entity_memory for all alive entities based on vision."""
@@ -758,7 +752,7 @@ class WorldLoop:
                 x_hi = min(grid_w - 1, ex + remaining)
                 row_base = ty * grid_w
                 for tx in range(x_lo, x_hi + 1):
-                    tmem[(tx, ty)] = tiles[row_base + tx].value
+                    tmem[(tx, ty)] = int(tiles[row_base + tx])
 
             # Record visible entities — use spatial hash instead of full scan
             nearby_ids = spatial.query_radius(entity.pos, vr)
@@ -831,22 +825,22 @@ class WorldLoop:
                 continue
 
             # --- Intruder on hostile territory ---
-            territory_info = reg.territory_for(tile_owner)
-            if territory_info is None:
+            debuff = reg.debuff_vectors_for(tile_owner)
+            if debuff is None:
                 continue
+            atk_mult, def_mult, spd_mult, alert_r = debuff
 
             # Apply / refresh territory debuff on the intruder
             entity.remove_effects_by_type(EffectType.TERRITORY_DEBUFF)
             entity.effects.append(territory_debuff(
-                atk_mult=territory_info.atk_debuff,
-                def_mult=territory_info.def_debuff,
-                spd_mult=territory_info.spd_debuff,
+                atk_mult=atk_mult,
+                def_mult=def_mult,
+                spd_mult=spd_mult,
                 duration=cfg.territory_debuff_duration,
-                source=f"{tile_owner.name}_territory",
+                source=_TERRITORY_SOURCE[tile_owner],
             ))
 
             # Alert nearby defenders: switch them to ALERT state
-            alert_r = territory_info.alert_radius
             for defender in self._world.entities.values():
                 if (
                     defender.alive
@@ -977,7 +971,7 @@ class WorldLoop:
 
     def _try_loot_chest(self, entity, pos) -> None:
         """If there's an available treasure chest at pos, loot it."""
-        from src.core.items import CHEST_LOOT_TABLES
+        from src.core.items import CHEST_LOOT_COLUMNS, EMPTY_CHEST_LOOT_COLUMNS
         from src.core.enums import Domain
         for chest in self._world.treasure_chests.values():
             if chest.pos == pos and chest.is_available:
@@ -987,14 +981,17 @@ class WorldLoop:
                     if guard and guard.alive:
                         continue  # Guard still alive, can't loot
                 # Generate loot from chest loot table
-                loot_table = CHEST_LOOT_TABLES.get(chest.tier, [])
+                ids, chances, min_counts, max_counts = CHEST_LOOT_COLUMNS.get(
+                    chest.tier, EMPTY_CHEST_LOOT_COLUMNS)
                 loot_items: list[str] = []
-                for item_id, chance, min_c, max_c in loot_table:
-                    roll = self._rng.next_float(Domain.LOOT, entity.id, self._world.tick + chest.chest_id)
+                roll_tick = self._world.tick + chest.chest_id
+                # Every row rolls with the same (entity, tick) key, so one
+                # draw serves the whole table.
+                roll = self._rng.next_float(Domain.LOOT, entity.id, roll_tick)
+                for item_id, chance, min_c, max_c in zip(ids, chances, min_counts, max_counts):
                     if roll < chance:
                         count = self._rng.next_int(
-                            Domain.LOOT, entity.id, self._world.tick + chest.chest_id + 100,
-                            min_c, max_c)
+                            Domain.LOOT, entity.id, roll_tick + 100, min_c, max_c)
                         loot_items.extend([item_id] * count)
                 # Drop loot on the ground at chest position
                 if loot_items:
@@ -1045,21 +1042,35 @@ class WorldLoop:
             entity.quests = [q for q in entity.quests if not q.completed or tick % 50 != 0]
 
     def _tick_effects(self) -> None:
-        """Tick down status effect durations, apply hp_per_tick, and remove expired."""
+        """Tick down status effect durations, apply hp_per_tick, and remove expired.
+
+        Single pass per entity: durations are decremented inline and the
+        effect list is only rebuilt when something actually expired.
+        """
         for entity in self._world.entities.values():
-            if not entity.alive or entity.kind == "generator":
-                continue
-            if not entity.effects:
+            effects = entity.effects
+            if not effects or not entity.alive or entity.kind == "generator":
                 continue
-            for eff in entity.effects:
+            stats = entity.stats
+            max_hp = None
+            any_expired = False
+            for eff in effects:
+                remaining = eff.remaining_ticks
+                if remaining == 0:
+                    any_expired = True
+                    continue
                 # Apply hp_per_tick (positive = regen, negative = DoT)
-                if eff.hp_per_tick != 0 and not eff.expired:
-                    entity.stats.hp = max(0, min(
-                        entity.stats.hp + eff.hp_per_tick,
-                        entity.effective_max_hp(),
-                    ))
-                eff.tick()
-            entity.effects = [e for e in entity.effects if not e.expired]
+                hp_delta = eff.hp_per_tick
+                if hp_delta:
+                    if max_hp is None:
+                        max_hp = entity.effective_max_hp()
+                    stats.hp = max(0, min(stats.hp + hp_delta, max_hp))
+                if remaining > 0:
+                    eff.remaining_ticks = remaining - 1
+                    if remaining == 1:
+                        any_expired = True
+            if any_expired:
+                entity.effects = [e for e in effects if e.remaining_ticks != 0]
 
     def _update_entity_goals(self) -> None:
         """Derive behavioral goals for each entity based on state and context."""
@@ -1388,7 +1399,7 @@ class WorldLoop:
                 entity.effects.clear()
                 # Reset inventory (hero loses carried items on death, keeps equipment)
                 if entity.inventory:
-                    entity.inventory.items.clear()
+                    entity.inventory.clear_items()
                 self._world.spatial_index.move(eid, old_pos, entity.home_pos)
                 logger.info(
                     "Tick %d: Hero #%d died → respawning at home %s in %d ticks.",
@@ -4,14 +4,13 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from src.core.classes import mob_class_for
 from src.core.entity_builder import EntityBuilder
-from src.core.enums import AIState, Domain, EnemyTier
+from src.core.enums import AIState, Domain, EnemyTier, Material
 from src.core.faction import Faction
 from src.core.items import (
-    Inventory, LOOT_TABLES, TIER_KIND_NAMES, TIER_STARTING_GEAR, ITEM_REGISTRY,
-    RACE_TIER_KINDS, RACE_STARTING_GEAR, RACE_STAT_MODS, RACE_LOOT_TABLES, RACE_FACTION,
-    DIFFICULTY_DROP_MULTIPLIER, DIFFICULTY_BONUS_LOOT,
+    Inventory, LOOT_COLUMNS, NO_GEAR, TIER_KIND_NAMES, TIER_GEAR_SLOTS,
+    RACE_TIER_KINDS, RACE_GEAR_SLOTS, RACE_STAT_MODS, RACE_LOOT_COLUMNS, RACE_FACTION,
+    DIFFICULTY_DROP_MULTIPLIER, DIFFICULTY_BONUS_LOOT_COLUMNS, EMPTY_LOOT_COLUMNS, LootColumns,
 )
 from src.core.models import Entity, Vector2
 from src.core.regions import DIFFICULTY_TIERS
@@ -34,11 +33,13 @@ _TIER_STATS: dict[int, tuple[float, float, int, int, float, float, int]] = {
 class EntityGenerator:
     """Spawns entities at a configurable interval up to a population cap."""
 
-    __slots__ = ("_config", "_rng")
+    __slots__ = ("_config", "_rng", "_builder")
 
     def __init__(self, config: SimulationConfig, rng: DeterministicRNG) -> None:
         self._config = config
         self._rng = rng
+        # One builder recycled via reset(); spawning runs on the tick thread only.
+        self._builder = EntityBuilder(rng, 0)
 
     def should_spawn(self, world: WorldState) -> bool:
         alive_count = sum(1 for e in world.entities.values() if e.kind != "generator" and e.alive)
@@ -69,26 +70,26 @@ class EntityGenerator:
         hp_m, atk_m, def_base, spd_mod, crit, evasion, luck = _TIER_STATS.get(
             tier, _TIER_STATS[EnemyTier.BASIC])
 
-        base_hp = int((15 + self._rng.next_int(Domain.SPAWN, eid, tick + 2, 0, 10)) * hp_m * diff.hp)
-        base_atk = int((3 + self._rng.next_int(Domain.SPAWN, eid, tick + 3, 0, 4)) * atk_m * diff.atk)
-        base_spd = 8 + self._rng.next_int(Domain.SPAWN, eid, tick + 4, 0, 4) + spd_mod
-        base_def = int((def_base + self._rng.next_int(Domain.SPAWN, eid, tick + 5, 0, 2)) * diff.def_)
+        next_int = self._rng.next_int
+        spawn_d = Domain.SPAWN
+        base_hp = int((15 + next_int(spawn_d, eid, tick + 2, 0, 10)) * hp_m * diff.hp)
+        base_atk = int((3 + next_int(spawn_d, eid, tick + 3, 0, 4)) * atk_m * diff.atk)
+        base_spd = 8 + next_int(spawn_d, eid, tick + 4, 0, 4) + spd_mod
+        base_def = int((def_base + next_int(spawn_d, eid, tick + 5, 0, 2)) * diff.def_)
 
-        level = self._rng.next_int(Domain.SPAWN, eid, tick + 6, diff.level_min, diff.level_max)
+        level = next_int(spawn_d, eid, tick + 6, diff.level_min, diff.level_max)
         kind = TIER_KIND_NAMES.get(tier, "goblin")
         ai_state = self._resolve_ai_state(tier, near_pos)
         inv = self._build_goblin_inventory(eid, tick, tier, difficulty_tier)
 
-        mob_cls = mob_class_for("goblin", tier)
         entity = (
-            EntityBuilder(self._rng, eid, tick=tick)
-            .kind(kind)
+            self._builder.reset(self._rng, eid, tick)
+            .from_mob_template("goblin", kind, tier)
             .at(pos)
             .home(near_pos)
             .leash(self._config.mob_leash_radius)
             .ai_state(ai_state)
             .faction(Faction.GOBLIN_HORDE)
-            .tier(tier)
             .with_base_stats(
                 hp=base_hp, atk=base_atk, def_=base_def, spd=max(base_spd, 1),
                 luck=luck, crit_rate=crit, crit_dmg=1.5, evasion=evasion,
@@ -96,15 +97,33 @@ class EntityGenerator:
                 gold=int(self._rng.next_int(Domain.LOOT, eid, tick, 0, 10 + tier * 10) * diff.gold),
             )
             .with_existing_inventory(inv)
-            .with_mob_class(mob_cls)
             .with_mob_attributes(3 + tier * 2, tier)
-            .with_race_skills(kind)
             .with_traits(race_prefix="goblin")
             .build()
         )
         entity.difficulty_tier = difficulty_tier
         return entity
 
+    def spawn_many(
+        self, world: WorldState, count: int, tier: int | None = None,
+        near_pos: Vector2 | None = None, difficulty_tier: int = 1,
+    ) -> list[Entity]:
+        """Spawn *count* tiered entities and add them to *world*.
+
+        Equivalent to calling spawn() + world.add_entity() in a loop (each
+        entity's draws are keyed by its own id), with the per-call method
+        lookups hoisted out of the loop.
+        """
+        spawn = self.spawn
+        add = world.add_entity
+        spawned: list[Entity] = []
+        append = spawned.append
+        for _ in range(count):
+            entity = spawn(world, tier, near_pos, difficulty_tier)
+            add(entity)
+            append(entity)
+        return spawned
+
     def spawn_race(
         self, world: WorldState, race: str,
         tier: int | None = None, near_pos: Vector2 | None = None,
@@ -131,12 +150,14 @@ class EntityGenerator:
         hp_m, atk_m, def_base, spd_mod, t_crit, t_evasion, t_luck = _TIER_STATS.get(
             tier, _TIER_STATS[EnemyTier.BASIC])
 
-        base_hp = int((15 + self._rng.next_int(Domain.SPAWN, eid, tick + 2, 0, 10)) * hp_m * r_hp_m * diff.hp)
-        base_atk = int((3 + self._rng.next_int(Domain.SPAWN, eid, tick + 3, 0, 4)) * atk_m * r_atk_m * diff.atk)
-        base_spd = 8 + self._rng.next_int(Domain.SPAWN, eid, tick + 4, 0, 4) + spd_mod + r_spd_mod
-        base_def = int((def_base + r_def_mod + self._rng.next_int(Domain.SPAWN, eid, tick + 5, 0, 2)) * diff.def_)
+        next_int = self._rng.next_int
+        spawn_d = Domain.SPAWN
+        base_hp = int((15 + next_int(spawn_d, eid, tick + 2, 0, 10)) * hp_m * r_hp_m * diff.hp)
+        base_atk = int((3 + next_int(spawn_d, eid, tick + 3, 0, 4)) * atk_m * r_atk_m * diff.atk)
+        base_spd = 8 + next_int(spawn_d, eid, tick + 4, 0, 4) + spd_mod + r_spd_mod
+        base_def = int((def_base + r_def_mod + next_int(spawn_d, eid, tick + 5, 0, 2)) * diff.def_)
 
-        level = self._rng.next_int(Domain.SPAWN, eid, tick + 6, diff.level_min, diff.level_max)
+        level = next_int(spawn_d, eid, tick + 6, diff.level_min, diff.level_max)
         kind_map = RACE_TIER_KINDS.get(race, {})
         kind = kind_map.get(tier, race)
         faction = RACE_FACTION.get(race, Faction.GOBLIN_HORDE)
@@ -152,16 +173,14 @@ class EntityGenerator:
         r_per = r_spd_mod  # fast races are more perceptive
         r_cha = 0  # monsters generally have low charisma
 
-        mob_cls = mob_class_for(race, tier)
         entity = (
-            EntityBuilder(self._rng, eid, tick=tick)
-            .kind(kind)
+            self._builder.reset(self._rng, eid, tick)
+            .from_mob_template(race, kind, tier)
             .at(pos)
             .home(near_pos)
             .leash(self._config.mob_leash_radius)
             .ai_state(ai_state)
             .faction(faction)
-            .tier(tier)
             .with_base_stats(
                 hp=max(base_hp, 5), atk=max(base_atk, 1),
                 def_=max(base_def, 0), spd=max(base_spd, 1),
@@ -171,13 +190,11 @@ class EntityGenerator:
                 gold=int(self._rng.next_int(Domain.LOOT, eid, tick, 0, 10 + tier * 10) * diff.gold),
             )
             .with_existing_inventory(inv)
-            .with_mob_class(mob_cls)
             .with_race_attributes(
                 attr_base, tier,
                 r_str=r_str, r_agi=r_agi, r_vit=r_vit,
                 r_spi=r_spi, r_per=r_per, r_cha=r_cha,
             )
-            .with_race_skills(kind)
             .with_traits(race_prefix=race)
             .build()
         )
@@ -201,7 +218,7 @@ class EntityGenerator:
             y = self._rng.next_int(Domain.SPAWN, eid, tick + 1, 0, world.grid.height - 1)
             pos = Vector2(x, y)
 
-        if not world.grid.is_walkable(pos) or world.grid.is_town(pos) or world.grid.is_sanctuary(pos):
+        if not world.grid.is_walkable(pos) or world.grid.get(pos) in (Material.TOWN, Material.SANCTUARY):
             pos = self._find_nearest_walkable_non_town(world, pos)
         return pos
 
@@ -214,37 +231,26 @@ class EntityGenerator:
 
     def _build_goblin_inventory(self, eid: int, tick: int, tier: int, difficulty_tier: int = 1) -> Inventory:
         """Build inventory with tier-based starting gear, potions, and loot."""
+        # Starting equipment from tier template
+        weapon, armor, accessory = TIER_GEAR_SLOTS.get(tier, NO_GEAR)
         inv = Inventory(
             items=[],
             max_slots=self._config.goblin_inventory_slots + tier,
             max_weight=self._config.goblin_inventory_weight + tier * 3.0,
+            weapon=weapon, armor=armor, accessory=accessory,
         )
 
-        # Starting equipment from tier template
-        gear = TIER_STARTING_GEAR.get(tier, {})
-        for slot in ("weapon", "armor", "accessory"):
-            item_id = gear.get(slot)
-            if item_id and item_id in ITEM_REGISTRY:
-                setattr(inv, slot, item_id)
-
         # Potions based on tier
         potion_count = self._rng.next_int(Domain.ITEM, eid, tick, 0, 1 + tier)
         potion_type = "medium_hp_potion" if tier >= EnemyTier.WARRIOR else "small_hp_potion"
-        for _ in range(potion_count):
-            inv.add_item(potion_type)
+        inv.add_items_bulk({potion_type: potion_count})
 
         # Random extra loot — drop chances scaled by difficulty tier
         drop_mult = DIFFICULTY_DROP_MULTIPLIER.get(difficulty_tier, 1.0)
-        loot_table = LOOT_TABLES.get(tier, [])
-        for item_id, chance in loot_table:
-            if self._rng.next_bool(Domain.LOOT, eid, tick + 10 + hash(item_id) % 100, min(chance * 0.3 * drop_mult, 1.0)):
-                inv.add_item(item_id)
+        self._roll_loot(inv, eid, tick, LOOT_COLUMNS.get(tier, EMPTY_LOOT_COLUMNS), drop_mult)
 
         # Bonus loot from difficulty tier
-        bonus_loot = DIFFICULTY_BONUS_LOOT.get(difficulty_tier, [])
-        for item_id, chance in bonus_loot:
-            if self._rng.next_bool(Domain.LOOT, eid, tick + 50 + hash(item_id) % 100, chance):
-                inv.add_item(item_id)
+        self._roll_bonus_loot(inv, eid, tick, difficulty_tier)
 
         return inv
 
@@ -253,34 +259,42 @@ class EntityGenerator:
         difficulty_tier: int = 1,
     ) -> Inventory:
         """Build inventory with race-specific starting gear and loot."""
+        race_gear = RACE_GEAR_SLOTS.get(race)
+        weapon, armor, accessory = race_gear.get(tier, NO_GEAR) if race_gear else NO_GEAR
         inv = Inventory(
             items=[],
             max_slots=self._config.goblin_inventory_slots + tier,
             max_weight=self._config.goblin_inventory_weight + tier * 3.0,
+            weapon=weapon, armor=armor, accessory=accessory,
         )
 
-        race_gear = RACE_STARTING_GEAR.get(race, {})
-        gear = race_gear.get(tier, {})
-        for slot in ("weapon", "armor", "accessory"):
-            item_id = gear.get(slot)
-            if item_id and item_id in ITEM_REGISTRY:
-                setattr(inv, slot, item_id)
-
         # Race loot — drop chances scaled by difficulty tier
         drop_mult = DIFFICULTY_DROP_MULTIPLIER.get(difficulty_tier, 1.0)
-        loot_table = RACE_LOOT_TABLES.get(kind, [])
-        for item_id, chance in loot_table:
-            if self._rng.next_bool(Domain.LOOT, eid, tick + 10 + hash(item_id) % 100, min(chance * 0.3 * drop_mult, 1.0)):
-                inv.add_item(item_id)
+        self._roll_loot(inv, eid, tick, RACE_LOOT_COLUMNS.get(kind, EMPTY_LOOT_COLUMNS), drop_mult)
 
         # Bonus loot from difficulty tier
-        bonus_loot = DIFFICULTY_BONUS_LOOT.get(difficulty_tier, [])
-        for item_id, chance in bonus_loot:
-            if self._rng.next_bool(Domain.LOOT, eid, tick + 50 + hash(item_id) % 100, chance):
-                inv.add_item(item_id)
+        self._roll_bonus_loot(inv, eid, tick, difficulty_tier)
 
         return inv
 
+    def _roll_loot(
+        self, inv: Inventory, eid: int, tick: int, columns: LootColumns, drop_mult: float,
+    ) -> None:
+        """Roll a base drop table; chances are scaled to 30% × *drop_mult*."""
+        next_bool = self._rng.next_bool
+        ids, chances, salts = columns
+        for item_id, chance, salt in zip(ids, chances, salts):
+            if next_bool(Domain.LOOT, eid, tick + 10 + salt, min(chance * 0.3 * drop_mult, 1.0)):
+                inv.add_item(item_id)
+
+    def _roll_bonus_loot(self, inv: Inventory, eid: int, tick: int, difficulty_tier: int) -> None:
+        """Roll the difficulty tier's bonus table at face-value chances."""
+        next_bool = self._rng.next_bool
+        ids, chances, salts = DIFFICULTY_BONUS_LOOT_COLUMNS.get(difficulty_tier, EMPTY_LOOT_COLUMNS)
+        for item_id, chance, salt in zip(ids, chances, salts):
+            if next_bool(Domain.LOOT, eid, tick + 50 + salt, chance):
+                inv.add_item(item_id)
+
     def _roll_tier(self, eid: int, tick: int) -> int:
         """Deterministic tier roll: mostly BASIC, occasionally higher."""
         roll = self._rng.next_float(Domain.SPAWN, eid, tick + 10)
@@ -320,7 +334,7 @@ class EntityGenerator:
         queue: deque[Vector2] = deque([origin])
         while queue:
             pos = queue.popleft()
-            if world.grid.is_walkable(pos) and not world.grid.is_town(pos):
+            if world.grid.is_walkable(pos) and not world.grid.is_tile(pos, Material.TOWN):
                 return pos
             for dx, dy in ((0, -1), (1, 0), (0, 1), (-1, 0)):
                 npos = Vector2(pos.x + dx, pos.y + dy)
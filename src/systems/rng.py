@@ -14,6 +14,9 @@ import xxhash
 
 from src.core.enums import Domain
 
+_PACK = struct.Struct("<qiqi").pack
+_xxh64 = xxhash.xxh64_intdigest
+
 
 class DeterministicRNG:
     """Stateless domain-separated pseudo-random number generator.
@@ -30,8 +33,8 @@ class DeterministicRNG:
         self._seed = seed
 
     def _hash(self, domain: Domain, entity_id: int, tick: int) -> int:
-        payload = struct.pack("<qiqi", self._seed, domain.value, entity_id, tick)
-        return xxhash.xxh64(payload).intdigest()
+        # Domain is an IntEnum, so struct packs it directly (no .value lookup)
+        return _xxh64(_PACK(self._seed, domain, entity_id, tick))
 
     def next_float(self, domain: Domain, entity_id: int, tick: int) -> float:
         """Return a deterministic float in [0.0, 1.0)."""
@@ -45,3 +48,18 @@ class DeterministicRNG:
     def next_bool(self, domain: Domain, entity_id: int, tick: int, probability: float = 0.5) -> bool:
         """Return True with the given probability."""
         return self.next_float(domain, entity_id, tick) < probability
+
+    def next_ints_bounded(
+        self, domain: Domain, entity_id: int, tick_base: int, highs: tuple[int, ...],
+    ) -> tuple[int, ...]:
+        """Return one integer in [0, highs[i]] per bound, drawn at tick_base + i.
+
+        Identical to calling ``next_int(domain, entity_id, tick_base + i, 0, highs[i])``
+        for each i, but without the per-draw method-call overhead.
+        """
+        seed = self._seed
+        scale = self._MAX_UINT64 + 1
+        return tuple(
+            int(_xxh64(_PACK(seed, domain, entity_id, tick_base + i)) / scale * (high + 1))
+            for i, high in enumerate(highs)
+        )
@@ -87,11 +87,11 @@ class CombatArena:
         if weapon:
             inv.weapon = weapon
             if weapon not in inv.items:
-                inv.items.append(weapon)
+                inv.add_item(weapon)
         if armor:
             inv.armor = armor
             if armor not in inv.items:
-                inv.items.append(armor)
+                inv.add_item(armor)
         return inv
 
     def add_entity(
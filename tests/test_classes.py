@@ -7,6 +7,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 from src.core.classes import (
     HeroClass, SkillType, SkillTarget, SkillDef, SkillInstance,
     ClassDef, BreakthroughDef, CLASS_DEFS, BREAKTHROUGHS, SKILL_DEFS,
+    CLASS_BONUSES, CLASS_CAP_BONUSES, CLASS_DEFS_BY_ID, SKILL_COSTS,
     RACE_SKILLS, CLASS_SKILLS, can_breakthrough, available_class_skills,
     get_attr_value,
 )
@@ -141,6 +142,40 @@ class TestSkillInstance:
         # Minimum cooldown is 1
         assert si.effective_cooldown(1) == 1
 
+    def test_costs_cached_until_tier_changes(self):
+        sdef = SKILL_DEFS["power_strike"]
+        si = SkillInstance(skill_id="power_strike", mastery=24.5)
+        assert si.costs(sdef) == (sdef.stamina_cost, sdef.cooldown)
+        assert si.costs(sdef) is si.costs(sdef)
+        si.use(base_cooldown=sdef.cooldown)  # crosses into tier 1
+        assert si.mastery_tier == 1
+        assert si.costs(sdef) == (si.effective_stamina_cost(sdef.stamina_cost),
+                                  si.effective_cooldown(sdef.cooldown))
+
+    def test_costs_follow_assigned_mastery(self):
+        sdef = SKILL_DEFS["power_strike"]
+        si = SkillInstance(skill_id="power_strike")
+        assert si.costs(sdef) == (sdef.stamina_cost, sdef.cooldown)
+        si.mastery = 80.0  # restore paths assign mastery directly
+        assert si.costs(sdef) == (si.effective_stamina_cost(sdef.stamina_cost),
+                                  si.effective_cooldown(sdef.cooldown))
+        assert si.costs(sdef) == SKILL_COSTS["power_strike"][3]
+
+    def test_costs_use_the_given_skill_def(self):
+        si = SkillInstance(skill_id="power_strike")
+        si.costs(SKILL_DEFS["power_strike"])
+        other = SkillDef("custom", "Custom", "", SkillType.ACTIVE,
+                         SkillTarget.SELF, HeroClass.NONE, cooldown=7, stamina_cost=30)
+        assert si.costs(other) == (30, 7)
+
+    def test_cost_table_matches_effective_costs(self):
+        for sid, sdef in SKILL_DEFS.items():
+            for tier, mastery in enumerate((0.0, 25.0, 50.0, 75.0, 100.0)):
+                si = SkillInstance(skill_id=sid, mastery=mastery)
+                assert SKILL_COSTS[sid][tier] == (
+                    si.effective_stamina_cost(sdef.stamina_cost),
+                    si.effective_cooldown(sdef.cooldown))
+
     def test_copy(self):
         si = SkillInstance(skill_id="power_strike", cooldown_remaining=3, mastery=50.0, times_used=10)
         copy = si.copy()
@@ -168,6 +203,19 @@ class TestClassDefs:
         assert w.str_cap_bonus == 10
         assert w.breakthrough_class == HeroClass.CHAMPION
 
+    def test_bonus_tables_match_class_defs(self):
+        for hc, d in CLASS_DEFS.items():
+            assert CLASS_BONUSES[int(hc)] == (
+                d.str_bonus, d.agi_bonus, d.vit_bonus, d.int_bonus, d.spi_bonus,
+                d.wis_bonus, d.end_bonus, d.per_bonus, d.cha_bonus)
+            assert CLASS_CAP_BONUSES[int(hc)][0] == d.str_cap_bonus
+            assert CLASS_CAP_BONUSES[int(hc)][8] == d.cha_cap_bonus
+
+    def test_dense_class_table(self):
+        for hc in HeroClass:
+            assert CLASS_DEFS_BY_ID[hc] is CLASS_DEFS.get(hc)
+        assert CLASS_BONUSES[HeroClass.NONE] is None
+
     def test_breakthroughs_defined(self):
         assert HeroClass.WARRIOR in BREAKTHROUGHS
         assert HeroClass.RANGER in BREAKTHROUGHS
@@ -224,7 +272,12 @@ class TestAvailableClassSkills:
 
     def test_no_class(self):
         skills = available_class_skills(HeroClass.NONE, 10)
-        assert skills == []
+        assert skills == ()
+
+    def test_result_is_cached_tuple(self):
+        first = available_class_skills(HeroClass.MAGE, 3)
+        assert isinstance(first, tuple)
+        assert available_class_skills(HeroClass.MAGE, 3) is first
 
 
 class TestRaceSkills:
@@ -242,6 +295,16 @@ class TestRaceSkills:
         assert "berserker_rage" in RACE_SKILLS["orc"]
         assert "war_cry" in RACE_SKILLS["orc"]
 
+    def test_registries_are_read_only(self):
+        import pytest
+        with pytest.raises(TypeError):
+            RACE_SKILLS["hero"] = ()
+        with pytest.raises(TypeError):
+            SKILL_DEFS["rally"] = None
+        with pytest.raises(TypeError):
+            CLASS_DEFS[HeroClass.WARRIOR] = None
+        assert all(isinstance(v, tuple) for v in RACE_SKILLS.values())
+
     def test_all_race_skill_ids_valid(self):
         for kind, skill_ids in RACE_SKILLS.items():
             for sid in skill_ids:
@@ -410,11 +410,9 @@ class TestSkillEffects:
         assert eff.remaining_ticks == 2
         eff.tick()  # 2 -> 1
         assert eff.remaining_ticks == 1
-        assert not eff.expired
         eff.tick()  # 1 -> 0
         assert eff.remaining_ticks == 0
-        assert eff.expired
-        e.effects = [ef for ef in e.effects if not ef.expired]
+        e.effects = [ef for ef in e.effects if ef.remaining_ticks != 0]
         assert len(e.effects) == 0
 
     def test_hp_per_tick_dot(self):
@@ -449,3 +447,26 @@ class TestSkillEffects:
         assert eff.effect_type == EffectType.SKILL_DEBUFF
         assert eff.atk_mult == 0.85
         assert eff.source == "War Cry"
+
+    def test_precomputed_mults_match_skill_effect(self):
+        from src.core.classes import SKILL_DEFS, SKILL_EFFECT_MULTS
+        from src.core.effects import skill_effect, skill_effect_from_mults
+        assert SKILL_EFFECT_MULTS
+        for sid, mults in SKILL_EFFECT_MULTS.items():
+            sdef = SKILL_DEFS[sid]
+            expected = skill_effect(
+                atk_mod=sdef.atk_mod, def_mod=sdef.def_mod, spd_mod=sdef.spd_mod,
+                crit_mod=sdef.crit_mod, evasion_mod=sdef.evasion_mod,
+                duration=sdef.duration, source=sdef.name, is_debuff=True,
+            )
+            assert skill_effect_from_mults(mults, sdef.duration, sdef.name, is_debuff=True) == expected
+
+    def test_effect_copy_is_independent(self):
+        from src.core.effects import skill_effect
+        eff = skill_effect(atk_mod=0.2, hp_per_tick=-3, duration=4, source="test")
+        dup = eff.copy()
+        assert dup == eff
+        assert dup is not eff
+        dup.tick()
+        assert eff.remaining_ticks == 4
+        assert dup.remaining_ticks == 3
@@ -25,6 +25,9 @@ class _FakeRNG:
     def next_int(self, domain, eid, tick, lo, hi):
         return max(lo, min(self._int_val, hi))
 
+    def next_ints_bounded(self, domain, eid, tick_base, highs):
+        return tuple(max(0, min(self._int_val, hi)) for hi in highs)
+
     def next_float(self, domain, eid, tick):
         return self._float_val
 
@@ -79,6 +82,11 @@ class TestEntityBuilderBasic:
         entity = EntityBuilder(rng, 1).ai_state(AIState.GUARD_CAMP).build()
         assert entity.ai_state == AIState.GUARD_CAMP
 
+    def test_kind_is_interned(self):
+        kind = "".join(["goblin", "_scout"])  # runtime-built, not interned
+        entity = EntityBuilder(_FakeRNG(), 1).kind(kind).build()
+        assert entity.kind is sys.intern(kind)
+
     def test_faction_sets_faction(self):
         rng = _FakeRNG()
         entity = EntityBuilder(rng, 1).faction(Faction.GOBLIN_HORDE).build()
@@ -129,6 +137,15 @@ class TestEntityBuilderStats:
         assert entity.stats.hp > 50  # added some variance
         assert entity.stats.atk > 10
 
+    def test_stats_leading_field_order(self):
+        """build() passes these Stats fields positionally."""
+        from dataclasses import fields
+        from src.core.models import Stats
+        assert [f.name for f in fields(Stats)][:9] == [
+            "hp", "max_hp", "atk", "def_", "spd", "luck",
+            "crit_rate", "crit_dmg", "evasion",
+        ]
+
     def test_hero_stamina_minimum_50(self):
         rng = _FakeRNG()
         entity = (
@@ -202,6 +219,40 @@ class TestEntityBuilderHeroClass:
         # AGI: max(1, 5 + 2 + rng(0,3)->1) = 8
         assert entity.attributes.agi == 8
 
+    def test_batched_draws_match_per_attribute_next_int(self):
+        """Batched spawn draws reproduce the original per-attribute ticks."""
+        from src.core.attributes import Attributes
+        from src.systems.rng import DeterministicRNG
+        rng = DeterministicRNG(seed=1234)
+        eid, tick = 7, 40
+        entity = (
+            EntityBuilder(rng, eid, tick=tick)
+            .with_mob_attributes(5, tier=1)
+            .build()
+        )
+        def draw(off, hi):
+            return rng.next_int(Domain.SPAWN, eid, tick + off, 0, hi)
+        expected = Attributes(
+            str_=5 + draw(20, 3), agi=5 + draw(21, 3), vit=5 + draw(22, 3),
+            int_=3 + draw(23, 2), spi=3 + draw(26, 2), wis=3 + draw(24, 2),
+            end=5 + draw(25, 3), per=4 + draw(27, 2), cha=2 + draw(28, 2),
+        )
+        a = entity.attributes
+        assert (a.str_, a.agi, a.vit, a.int_, a.spi, a.wis, a.end, a.per, a.cha) == (
+            expected.str_, expected.agi, expected.vit, expected.int_, expected.spi,
+            expected.wis, expected.end, expected.per, expected.cha,
+        )
+
+    def test_next_ints_bounded_matches_next_int(self):
+        from src.systems.rng import DeterministicRNG
+        rng = DeterministicRNG(seed=99)
+        highs = (15, 4, 3, 2, 0, 100)
+        for eid in range(20):
+            got = rng.next_ints_bounded(Domain.SPAWN, eid, 5, highs)
+            assert got == tuple(
+                rng.next_int(Domain.SPAWN, eid, 5 + i, 0, hi) for i, hi in enumerate(highs)
+            )
+
 
 # ---------------------------------------------------------------------------
 # Skills tests
@@ -237,6 +288,57 @@ class TestEntityBuilderSkills:
         )
         assert len(entity.skills) >= 2  # at least race + class skills
 
+    def test_mob_template_matches_explicit_chain(self):
+        from src.core.classes import mob_class_for
+        from src.systems.rng import DeterministicRNG
+        rng = DeterministicRNG(seed=5)
+        a = (
+            EntityBuilder(rng, 3, tick=9)
+            .kind("orc_warrior").tier(2)
+            .with_mob_class(mob_class_for("orc", 2))
+            .with_race_attributes(7, 2, r_str=3)
+            .with_race_skills("orc_warrior")
+            .build()
+        )
+        b = (
+            EntityBuilder(rng, 3, tick=9)
+            .from_mob_template("orc", "orc_warrior", 2)
+            .with_race_attributes(7, 2, r_str=3)
+            .build()
+        )
+        assert (b.kind, b.tier, b.hero_class) == (a.kind, a.tier, a.hero_class)
+        assert [s.skill_id for s in b.skills] == [s.skill_id for s in a.skills]
+        assert b.attributes.str_ == a.attributes.str_
+        assert b.attribute_caps.cha_cap == a.attribute_caps.cha_cap
+
+    def test_reset_builder_matches_fresh_builder(self):
+        from src.systems.rng import DeterministicRNG
+        rng = DeterministicRNG(seed=3)
+        b = EntityBuilder(rng, 1)
+        first = b.from_mob_template("wolf", "wolf", 1).with_mob_attributes(5, 1).build()
+        again = b.reset(rng, 2, tick=4).with_mob_attributes(5, 1).build()
+        fresh = EntityBuilder(rng, 2, tick=4).with_mob_attributes(5, 1).build()
+        assert (again.kind, again.hero_class, again.skills) == (fresh.kind, fresh.hero_class, [])
+        assert again.attributes.str_ == fresh.attributes.str_
+        assert first.skills and first.skills is not again.skills
+
+    def test_same_tier_caps_not_shared_between_entities(self):
+        from src.core.attributes import level_up_attributes
+        rng = _FakeRNG()
+        a = EntityBuilder(rng, 1).with_mob_attributes(5, 2).build()
+        b = EntityBuilder(rng, 2).with_mob_attributes(5, 2).build()
+        assert a.attribute_caps is not b.attribute_caps
+        level_up_attributes(a.attributes, a.attribute_caps)
+        assert b.attribute_caps.str_cap == 25
+
+    def test_skill_instances_not_shared_between_entities(self):
+        rng = _FakeRNG()
+        a = EntityBuilder(rng, 1).from_mob_template("wolf", "wolf", 0).build()
+        b = EntityBuilder(rng, 2).from_mob_template("wolf", "wolf", 0).build()
+        assert [s.skill_id for s in a.skills] == [s.skill_id for s in b.skills]
+        a.skills[0].cooldown_remaining = 5
+        assert b.skills[0].cooldown_remaining == 0
+
     def test_no_skills_by_default(self):
         rng = _FakeRNG()
         entity = EntityBuilder(rng, 1).build()
@@ -274,6 +376,46 @@ class TestEntityBuilderInventory:
         assert entity.inventory is not None
         assert len(entity.inventory.items) == 2
 
+    def test_starting_items_respect_slot_and_weight_limits(self):
+        rng = _FakeRNG()
+        by_slots = (
+            EntityBuilder(rng, 1)
+            .with_inventory(max_slots=2, max_weight=50)
+            .with_starting_items(["small_hp_potion"] * 5)
+            .build()
+        )
+        assert by_slots.inventory.items == ["small_hp_potion"] * 2
+        # small_hp_potion weighs 0.5, iron_sword 3.0 equipped
+        by_weight = (
+            EntityBuilder(rng, 2)
+            .with_inventory(max_slots=10, max_weight=4.0, weapon="iron_sword")
+            .with_starting_items(["small_hp_potion"] * 5)
+            .build()
+        )
+        assert by_weight.inventory.items == ["small_hp_potion"] * 2
+
+    def test_starting_items_keep_mixed_order(self):
+        rng = _FakeRNG()
+        ids = ["small_hp_potion", "iron_ore", "small_hp_potion", "small_hp_potion"]
+        entity = (
+            EntityBuilder(rng, 1)
+            .with_inventory(max_slots=10, max_weight=50)
+            .with_starting_items(ids)
+            .build()
+        )
+        assert entity.inventory.items == ids
+        # Near the weight cap the kept items match one-by-one add_item()
+        ref = Inventory(items=[], max_slots=10, max_weight=2.7)
+        for iid in ids:
+            ref.add_item(iid)
+        capped = (
+            EntityBuilder(rng, 2)
+            .with_inventory(max_slots=10, max_weight=2.7)
+            .with_starting_items(ids)
+            .build()
+        )
+        assert capped.inventory.items == ref.items == ["small_hp_potion", "iron_ore"]
+
     def test_with_existing_inventory(self):
         rng = _FakeRNG()
         inv = Inventory(items=[], max_slots=5, max_weight=20.0, weapon="club")
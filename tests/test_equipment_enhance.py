@@ -22,7 +22,7 @@ from src.core.enums import ItemType, Rarity
 from src.core.items import (
     ITEM_REGISTRY, HomeStorage, Inventory, TreasureChest,
     HOUSE_UPGRADE_COSTS, CHEST_LOOT_TABLES,
-    item_power, _item_power,
+    ITEM_POWER, EQUIPPABLE_TYPES, item_power, _item_power,
 )
 from src.core.models import Entity, Stats, Vector2
 
@@ -128,6 +128,86 @@ class TestAutoEquipBest:
         result = inv.auto_equip_best("iron_sword")
         assert result is False
 
+    def test_equippable_types(self):
+        assert EQUIPPABLE_TYPES == {ItemType.WEAPON, ItemType.ARMOR, ItemType.ACCESSORY}
+        for iid, t in ITEM_REGISTRY.items():
+            inv = Inventory(items=[iid], max_slots=10, max_weight=500.0)
+            assert inv.equip(iid) is (t.item_type in EQUIPPABLE_TYPES)
+
+
+class TestInventoryCounts:
+    def test_counts_track_bag_changes(self):
+        inv = Inventory(items=["small_hp_potion", "iron_sword", "small_hp_potion"],
+                        max_slots=10, max_weight=50.0)
+        assert inv.count_item("small_hp_potion") == 2
+        assert inv.remove_item("small_hp_potion")
+        assert inv.count_item("small_hp_potion") == 1
+        assert inv.add_item("small_hp_potion")
+        assert inv.items == ["iron_sword", "small_hp_potion", "small_hp_potion"]
+        assert inv.equip("iron_sword")
+        assert not inv.has_consumable("iron_sword")
+        assert not inv.remove_item("iron_sword")
+        assert inv.count_item("small_hp_potion") == 2
+
+    def test_weight_follows_bag_and_slots(self):
+        inv = Inventory(items=["iron_sword"], max_slots=10, max_weight=50.0)
+        sword = ITEM_REGISTRY["iron_sword"].weight
+        potion = ITEM_REGISTRY["small_hp_potion"].weight
+        assert inv.current_weight == sword
+        inv.add_item("small_hp_potion")
+        assert inv.current_weight == sword + potion
+        inv.remove_item("iron_sword")
+        assert inv.current_weight == potion
+        inv.weapon = "iron_sword"  # direct slot assignment is still counted
+        assert inv.current_weight == potion + sword
+        assert inv.copy().current_weight == inv.current_weight
+        inv.weapon = None
+        assert inv.current_weight == potion
+
+    def test_copy_is_independent(self):
+        import copy
+        inv = Inventory(items=["small_hp_potion"], max_slots=10, max_weight=50.0,
+                        weapon="iron_sword")
+        dup = copy.copy(inv)
+        dup.add_item("small_hp_potion")
+        dup.weapon = None
+        assert inv.count_item("small_hp_potion") == 1
+        assert inv.items == ["small_hp_potion"]
+        assert inv.equipment_bonus("atk_bonus") == ITEM_REGISTRY["iron_sword"].atk_bonus
+        assert dup.equipment_bonus("atk_bonus") == 0
+
+    def test_clear_items_keeps_equipment(self):
+        inv = Inventory(items=["small_hp_potion"], max_slots=10, max_weight=50.0,
+                        weapon="iron_sword")
+        inv.clear_items()
+        assert inv.items == []
+        assert inv.count_item("small_hp_potion") == 0
+        assert inv.weapon == "iron_sword"
+
+
+class TestEquipmentBonus:
+    def test_bonus_sums_equipped_templates(self):
+        inv = Inventory(weapon="iron_sword", armor="leather_vest")
+        for stat in ("atk_bonus", "def_bonus", "crit_rate_bonus"):
+            expected = (getattr(ITEM_REGISTRY["iron_sword"], stat)
+                        + getattr(ITEM_REGISTRY["leather_vest"], stat))
+            assert inv.equipment_bonus(stat) == expected
+
+    def test_totals_follow_slot_changes(self):
+        inv = Inventory(items=["steel_greatsword"], max_slots=10, max_weight=50.0,
+                        weapon="wooden_club")
+        assert inv.equipment_bonus("atk_bonus") == ITEM_REGISTRY["wooden_club"].atk_bonus
+        inv.equip("steel_greatsword")
+        assert inv.equipment_bonus("atk_bonus") == ITEM_REGISTRY["steel_greatsword"].atk_bonus
+        inv.weapon = None  # direct assignment invalidates the cached totals
+        assert inv.equipment_bonus("atk_bonus") == 0
+
+    def test_non_bonus_field_and_unknown_item(self):
+        inv = Inventory(weapon="iron_sword", armor="no_such_item")
+        assert inv.equipment_bonus("weight") == ITEM_REGISTRY["iron_sword"].weight
+        assert inv.equipment_bonus("def_bonus") == ITEM_REGISTRY["iron_sword"].def_bonus
+        assert inv.equipment_bonus("not_a_field") == 0
+
 
 class TestItemPower:
     def test_known_item_power(self):
@@ -142,6 +222,23 @@ class TestItemPower:
         assert item_power("steel_greatsword") > item_power("iron_sword")
         assert item_power("iron_sword") > item_power("wooden_club")
 
+    def test_registry_ids_interned(self):
+        import sys
+        for iid, t in ITEM_REGISTRY.items():
+            assert iid is sys.intern(iid)
+            assert t.item_id is iid
+
+    def test_registries_are_read_only(self):
+        with pytest.raises(TypeError):
+            ITEM_REGISTRY["iron_sword"] = None
+        with pytest.raises(TypeError):
+            ITEM_POWER["iron_sword"] = 0
+
+    def test_power_table_covers_registry(self):
+        assert ITEM_POWER.keys() == ITEM_REGISTRY.keys()
+        for iid, t in ITEM_REGISTRY.items():
+            assert ITEM_POWER[iid] == _item_power(t)
+
 
 # =====================================================================
 # T3: Home Storage
@@ -220,33 +317,33 @@ class TestExpandedShop:
 class TestSkillLearningRequirements:
     def test_tier1_skill_no_prereq(self):
         sdef = SKILL_DEFS["power_strike"]
-        can, reason = can_learn_skill(sdef, level=1, known_skills=[])
+        can, reason = can_learn_skill(sdef, level=1, known_skills={})
         assert can is True
 
     def test_tier2_skill_needs_mastery(self):
         sdef = SKILL_DEFS["shield_wall"]
         # No prerequisite skill known
-        can, reason = can_learn_skill(sdef, level=3, known_skills=[])
+        can, reason = can_learn_skill(sdef, level=3, known_skills={})
         assert can is False
         assert "Power Strike" in reason
 
     def test_tier2_skill_low_mastery(self):
         sdef = SKILL_DEFS["shield_wall"]
         prereq = SkillInstance(skill_id="power_strike", mastery=10.0)
-        can, reason = can_learn_skill(sdef, level=3, known_skills=[prereq])
+        can, reason = can_learn_skill(sdef, level=3, known_skills={"power_strike": prereq})
         assert can is False
         assert "mastery" in reason.lower()
 
     def test_tier2_skill_sufficient_mastery(self):
         sdef = SKILL_DEFS["shield_wall"]
         prereq = SkillInstance(skill_id="power_strike", mastery=25.0)
-        can, reason = can_learn_skill(sdef, level=3, known_skills=[prereq])
+        can, reason = can_learn_skill(sdef, level=3, known_skills={"power_strike": prereq})
         assert can is True
 
     def test_level_too_low(self):
         sdef = SKILL_DEFS["shield_wall"]
         prereq = SkillInstance(skill_id="power_strike", mastery=50.0)
-        can, reason = can_learn_skill(sdef, level=1, known_skills=[prereq])
+        can, reason = can_learn_skill(sdef, level=1, known_skills={"power_strike": prereq})
         assert can is False
         assert "level" in reason.lower()
 
@@ -255,7 +352,7 @@ class TestSkillLearningRequirements:
         # Need shield_wall mastery >= 25
         s1 = SkillInstance(skill_id="power_strike", mastery=50.0)
         s2 = SkillInstance(skill_id="shield_wall", mastery=30.0)
-        can, reason = can_learn_skill(sdef, level=5, known_skills=[s1, s2])
+        can, reason = can_learn_skill(sdef, level=5, known_skills={"power_strike": s1, "shield_wall": s2})
         assert can is True
 
     def test_all_classes_have_chains(self):
@@ -292,6 +389,22 @@ class TestTreasureChest:
         assert chest.try_respawn(150)
         assert not chest.looted
         assert chest.is_available
+        # An available chest never respawns again
+        assert not chest.try_respawn(10**9)
+
+    def test_constructed_looted_respawns_on_next_check(self):
+        chest = TreasureChest(chest_id=1, pos=Vector2(5, 5), looted=True)
+        assert not chest.is_available
+        assert chest.try_respawn(0)
+        assert chest.is_available
+        scheduled = TreasureChest(chest_id=2, pos=Vector2(5, 5), looted=True, respawn_at=40)
+        assert not scheduled.try_respawn(39)
+        assert scheduled.try_respawn(40)
+
+    def test_constructed_available_ignores_respawn_at(self):
+        chest = TreasureChest(chest_id=1, pos=Vector2(5, 5), respawn_at=10)
+        assert not chest.try_respawn(10**6)
+        assert chest.is_available
 
     def test_copy(self):
         chest = TreasureChest(chest_id=1, pos=Vector2(5, 5), tier=3, looted=True)
@@ -0,0 +1,157 @@
+"""Tests for the faction registry — relations, territories, and kind mapping."""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.core.enums import Material
+from src.core.faction import Faction, FactionRegistry, FactionRelation, TerritoryInfo
+
+
+# ---------------------------------------------------------------------------
+# Default registry factory
+# ---------------------------------------------------------------------------
+
+class TestDefaultRegistry:
+    """Test the shared and fresh default registries."""
+
+    def test_default_is_shared(self):
+        assert FactionRegistry.default() is FactionRegistry.default()
+
+    def test_fresh_default_is_independent(self):
+        fresh = FactionRegistry.fresh_default()
+        assert fresh is not FactionRegistry.default()
+        fresh.set_relation(Faction.HERO_GUILD, Faction.WOLF_PACK, FactionRelation.ALLIED)
+        assert FactionRegistry.default().is_hostile(Faction.HERO_GUILD, Faction.WOLF_PACK)
+
+    def test_default_is_read_only(self):
+        import pytest
+        reg = FactionRegistry.default()
+        with pytest.raises(TypeError):
+            reg.set_relation(Faction.HERO_GUILD, Faction.WOLF_PACK, FactionRelation.ALLIED)
+        with pytest.raises(TypeError):
+            reg.set_relation_block((Faction.UNDEAD, Faction.WOLF_PACK), FactionRelation.ALLIED)
+        with pytest.raises(TypeError):
+            reg.set_territory(Faction.UNDEAD, TerritoryInfo(tile=Material.SWAMP))
+        with pytest.raises(TypeError):
+            reg.register_kind("slime", Faction.UNDEAD)
+        assert reg.is_hostile(Faction.HERO_GUILD, Faction.WOLF_PACK)
+        FactionRegistry.fresh_default().register_kind("slime", Faction.UNDEAD)
+
+    def test_default_contents(self):
+        reg = FactionRegistry.default()
+        assert reg.is_hostile(Faction.HERO_GUILD, Faction.GOBLIN_HORDE)
+        assert reg.relation(Faction.GOBLIN_HORDE, Faction.ORC_TRIBE) == FactionRelation.NEUTRAL
+        assert reg.territory_for(Faction.GOBLIN_HORDE).tile == Material.CAMP
+        assert reg.faction_for_kind("lich") == Faction.UNDEAD
+
+
+# ---------------------------------------------------------------------------
+# Relation matrix
+# ---------------------------------------------------------------------------
+
+class TestRelations:
+    """Test relation storage and queries."""
+
+    def test_unset_pairs_are_neutral(self):
+        reg = FactionRegistry()
+        assert reg.relation(Faction.WOLF_PACK, Faction.UNDEAD) is FactionRelation.NEUTRAL
+        assert not reg.is_hostile(Faction.WOLF_PACK, Faction.UNDEAD)
+
+    def test_set_relation_is_symmetric(self):
+        reg = FactionRegistry()
+        reg.set_relation(Faction.WOLF_PACK, Faction.UNDEAD, FactionRelation.HOSTILE)
+        assert reg.is_hostile(Faction.UNDEAD, Faction.WOLF_PACK)
+        assert reg.relation(Faction.WOLF_PACK, Faction.UNDEAD) is FactionRelation.HOSTILE
+
+    def test_relation_block_sets_all_distinct_pairs(self):
+        reg = FactionRegistry()
+        block = (Faction.WOLF_PACK, Faction.UNDEAD, Faction.ORC_TRIBE)
+        reg.set_relation_block(block, FactionRelation.HOSTILE)
+        for a in block:
+            for b in block:
+                assert reg.is_hostile(a, b) is (a != b)
+        assert not reg.is_hostile(Faction.WOLF_PACK, Faction.HERO_GUILD)
+
+    def test_self_relation_always_allied(self):
+        reg = FactionRegistry()
+        reg.set_relation(Faction.UNDEAD, Faction.UNDEAD, FactionRelation.HOSTILE)
+        assert reg.is_allied(Faction.UNDEAD, Faction.UNDEAD)
+        assert not reg.is_hostile(Faction.UNDEAD, Faction.UNDEAD)
+
+
+# ---------------------------------------------------------------------------
+# Territory ownership
+# ---------------------------------------------------------------------------
+
+class TestTerritories:
+    """Test tile ownership lookups."""
+
+    def test_tile_owner(self):
+        reg = FactionRegistry.default()
+        assert reg.tile_owner(Material.TOWN) == Faction.HERO_GUILD
+        assert reg.tile_owner(Material.FLOOR) is None
+
+    def test_enemy_territory_respects_relations(self):
+        reg = FactionRegistry.default()
+        assert reg.is_enemy_territory(Faction.HERO_GUILD, Material.CAMP)
+        assert not reg.is_enemy_territory(Faction.ORC_TRIBE, Material.CAMP)  # neutral
+        assert not reg.is_enemy_territory(Faction.GOBLIN_HORDE, Material.CAMP)  # own
+        assert not reg.is_enemy_territory(Faction.HERO_GUILD, Material.ROAD)
+
+    def test_reassigned_territory_releases_old_tile(self):
+        reg = FactionRegistry()
+        reg.set_territory(Faction.UNDEAD, TerritoryInfo(tile=Material.SWAMP))
+        reg.set_territory(Faction.UNDEAD, TerritoryInfo(tile=Material.GRAVEYARD))
+        assert reg.tile_owner(Material.SWAMP) is None
+        assert reg.tile_owner(Material.GRAVEYARD) == Faction.UNDEAD
+
+    def test_owns_tile_follows_latest_territory(self):
+        reg = FactionRegistry()
+        assert not reg.owns_tile(Faction.UNDEAD, Material.SWAMP)
+        reg.set_territory(Faction.UNDEAD, TerritoryInfo(tile=Material.SWAMP))
+        assert reg.owns_tile(Faction.UNDEAD, Material.SWAMP)
+        reg.set_territory(Faction.UNDEAD, TerritoryInfo(tile=Material.GRAVEYARD))
+        assert not reg.is_home_territory(Faction.UNDEAD, Material.SWAMP)
+        assert reg.is_home_territory(Faction.UNDEAD, Material.GRAVEYARD)
+
+    def test_debuff_vectors_match_territory_info(self):
+        reg = FactionRegistry.default()
+        for fac in Faction:
+            info = reg.territory_for(fac)
+            assert reg.debuff_vectors_for(fac) == (
+                info.atk_debuff, info.def_debuff, info.spd_debuff, info.alert_radius,
+            )
+        assert FactionRegistry().debuff_vectors_for(Faction.UNDEAD) is None
+
+    def test_first_registered_owner_wins_shared_tile(self):
+        reg = FactionRegistry()
+        reg.set_territory(Faction.UNDEAD, TerritoryInfo(tile=Material.SWAMP))
+        reg.set_territory(Faction.LIZARDFOLK, TerritoryInfo(tile=Material.SWAMP))
+        assert reg.tile_owner(Material.SWAMP) == Faction.UNDEAD
+
+
+# ---------------------------------------------------------------------------
+# Batched relation masks
+# ---------------------------------------------------------------------------
+
+class TestRelationMasks:
+    """Test the per-faction hostile/allied masks."""
+
+    def test_masks_match_pairwise_queries(self):
+        reg = FactionRegistry.default()
+        for a in Faction:
+            hostile = reg.hostile_mask(a)
+            allied = reg.allied_mask(a)
+            for b in Faction:
+                assert hostile[b] is reg.is_hostile(a, b)
+                assert allied[b] is reg.is_allied(a, b)
+
+    def test_masks_follow_relation_updates(self):
+        reg = FactionRegistry()
+        assert not reg.hostile_mask(Faction.UNDEAD)[Faction.WOLF_PACK]
+        reg.set_relation(Faction.UNDEAD, Faction.WOLF_PACK, FactionRelation.HOSTILE)
+        assert reg.hostile_mask(Faction.WOLF_PACK)[Faction.UNDEAD]
+        reg.set_relation_block((Faction.UNDEAD, Faction.WOLF_PACK), FactionRelation.ALLIED)
+        assert reg.allied_mask(Faction.UNDEAD)[Faction.WOLF_PACK]
+        assert not reg.hostile_mask(Faction.UNDEAD)[Faction.WOLF_PACK]
@@ -8,8 +8,9 @@ from src.config import SimulationConfig
 from src.core.enums import EnemyTier, Rarity
 from src.core.grid import Grid
 from src.core.items import (
-    CHEST_LOOT_TABLES, DIFFICULTY_BONUS_LOOT, DIFFICULTY_DROP_MULTIPLIER,
-    ITEM_REGISTRY,
+    CHEST_LOOT_COLUMNS, CHEST_LOOT_TABLES, DIFFICULTY_BONUS_LOOT, DIFFICULTY_BONUS_LOOT_COLUMNS,
+    DIFFICULTY_DROP_MULTIPLIER, ITEM_REGISTRY, LOOT_COLUMNS, LOOT_TABLES,
+    RACE_LOOT_COLUMNS, RACE_LOOT_TABLES,
 )
 from src.core.models import Vector2
 from src.core.world_state import WorldState
@@ -72,6 +73,27 @@ class TestDifficultyBonusLoot(unittest.TestCase):
                 self.assertLessEqual(chance, 1.0)
 
 
+class TestLootColumns(unittest.TestCase):
+    """Test the column views used by the spawn-time loot rolls."""
+
+    def test_columns_mirror_tables(self):
+        for tables, columns in (
+            (LOOT_TABLES, LOOT_COLUMNS),
+            (RACE_LOOT_TABLES, RACE_LOOT_COLUMNS),
+            (DIFFICULTY_BONUS_LOOT, DIFFICULTY_BONUS_LOOT_COLUMNS),
+        ):
+            self.assertEqual(tables.keys(), columns.keys())
+            for key, table in tables.items():
+                ids, chances, salts = columns[key]
+                self.assertEqual(list(zip(ids, chances)), table)
+                self.assertEqual(salts, tuple(hash(i) % 100 for i in ids))
+
+    def test_chest_columns_mirror_tables(self):
+        self.assertEqual(CHEST_LOOT_TABLES.keys(), CHEST_LOOT_COLUMNS.keys())
+        for tier, table in CHEST_LOOT_TABLES.items():
+            self.assertEqual(list(zip(*CHEST_LOOT_COLUMNS[tier])), table)
+
+
 class TestChestLootTier4(unittest.TestCase):
     """Test that tier 4 chest loot table exists and contains epic items."""
 
@@ -136,5 +158,29 @@ class TestLootScalingInGenerator(unittest.TestCase):
                            f"Tier 4 total items ({total_items_t4}) should exceed tier 1 ({total_items_t1})")
 
 
+class TestSpawnMany(unittest.TestCase):
+    """spawn_many must match a spawn() + add_entity() loop."""
+
+    def test_matches_individual_spawns(self):
+        gen, _ = _make_generator(seed=7)
+        world = _make_world(seed=7)
+        batch = gen.spawn_many(world, 6, difficulty_tier=2)
+
+        gen2, _ = _make_generator(seed=7)
+        world2 = _make_world(seed=7)
+        single = []
+        for _ in range(6):
+            e = gen2.spawn(world2, difficulty_tier=2)
+            world2.add_entity(e)
+            single.append(e)
+
+        self.assertEqual(len(batch), 6)
+        self.assertEqual(list(world.entities), [e.id for e in batch])
+        for a, b in zip(batch, single):
+            self.assertEqual((a.id, a.kind, a.pos, a.tier), (b.id, b.kind, b.pos, b.tier))
+            self.assertEqual(a.stats.max_hp, b.stats.max_hp)
+            self.assertEqual(a.attributes.str_, b.attributes.str_)
+
+
 if __name__ == "__main__":
     unittest.main()
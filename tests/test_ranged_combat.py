@@ -21,7 +21,8 @@ from src.core.faction import Faction
 from src.core.grid import Grid, Material
 from src.core.items import (
     ITEM_REGISTRY, ItemTemplate, Inventory,
-    RACE_STARTING_GEAR, RACE_TIER_KINDS, TIER_STARTING_GEAR,
+    RACE_GEAR_SLOTS, RACE_STARTING_GEAR, RACE_TIER_KINDS,
+    TIER_GEAR_SLOTS, TIER_STARTING_GEAR,
 )
 from src.core.models import Entity, Stats, Vector2
 
@@ -139,6 +140,13 @@ class TestLineOfSight:
         g.set(Vector2(0, 0), Material.WALL)
         assert g.has_line_of_sight(0, 0, 5, 0) is True
 
+    def test_cached_result_invalidated_by_set(self):
+        g = _make_grid()
+        assert g.has_line_of_sight(0, 0, 5, 0) is True
+        assert g.has_line_of_sight(0, 0, 5, 0) is True  # served from cache
+        g.set(Vector2(3, 0), Material.WALL)
+        assert g.has_line_of_sight(0, 0, 5, 0) is False
+
 
 # =========================================================================
 # Cover system (has_adjacent_wall)
@@ -180,6 +188,85 @@ class TestCoverSystem:
         g = _make_grid(10, 10)
         assert g.has_adjacent_wall(0, 5) is True  # west is out of bounds
 
+    def test_cover_mask_invalidated_by_set(self):
+        g = _make_grid()
+        assert g.has_adjacent_wall(5, 5) is False  # builds the cached mask
+        g.set(Vector2(5, 4), Material.WALL)
+        assert g.has_adjacent_wall(5, 5) is True
+
+    def test_mask_matches_neighbor_lookups(self):
+        g = _make_grid(7, 5)
+        for x, y in ((0, 0), (3, 2), (6, 1), (2, 4), (4, 3)):
+            g.set(Vector2(x, y), Material.WALL)
+        mask = g.build_wall_adjacency_mask()
+        for y in range(5):
+            for x in range(7):
+                expected = any(
+                    g.get_xy(nx, ny) == Material.WALL
+                    for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1))
+                )
+                assert (mask[y * 7 + x] == 1) is expected
+
+
+# =========================================================================
+# Grid tile storage
+# =========================================================================
+
+class TestGridStorage:
+    def test_tiles_are_one_byte_each(self):
+        g = Grid(8, 4, Material.FOREST)
+        assert isinstance(g._tiles, bytearray)
+        assert len(g._tiles) == 32
+        assert g._tiles[0] == Material.FOREST
+
+    def test_get_returns_material_members(self):
+        g = _make_grid(5, 5)
+        g.set(Vector2(2, 3), Material.GRAVEYARD)
+        assert g.get(Vector2(2, 3)) is Material.GRAVEYARD
+        assert g.get_xy(2, 3) is Material.GRAVEYARD
+        assert g.get_xy(-1, 0) is Material.WALL
+
+    def test_is_walkable_xy_matches_is_walkable(self):
+        g = _make_grid(4, 4)
+        g.set(Vector2(1, 1), Material.WATER)
+        g.set(Vector2(2, 2), Material.FOREST)
+        for x in range(-1, 5):
+            for y in range(-1, 5):
+                assert g.is_walkable_xy(x, y) is g.is_walkable(Vector2(x, y))
+        assert g.is_walkable_xy(1, 1) is False
+        assert g.is_walkable_xy(2, 2) is True
+
+    def test_walkable_mask_follows_set(self):
+        g = Grid(3, 3, Material.WATER)
+        assert g.is_walkable_xy(1, 1) is False
+        g.set(Vector2(1, 1), Material.BRIDGE)
+        assert g.is_walkable_xy(1, 1) is True
+        g.set(Vector2(1, 1), Material.LAVA)
+        assert g.is_walkable_xy(1, 1) is False
+
+    def test_is_tile(self):
+        g = _make_grid(4, 4)
+        g.set(Vector2(1, 2), Material.CAMP)
+        assert g.is_tile(Vector2(1, 2), Material.CAMP) is True
+        assert g.is_tile(Vector2(1, 2), Material.TOWN) is False
+        assert g.is_tile(Vector2(9, 9), Material.WALL) is True  # out of bounds
+
+    def test_count_tiles_by_flag(self):
+        from src.core.grid import TILE_OPAQUE, TILE_WALKABLE
+        g = _make_grid(4, 4)
+        g.set(Vector2(0, 0), Material.WALL)
+        g.set(Vector2(1, 0), Material.WATER)
+        g.set(Vector2(2, 0), Material.FOREST)
+        assert g.count_tiles(TILE_WALKABLE) == 14
+        assert g.count_tiles(TILE_OPAQUE) == 1
+
+    def test_copy_is_independent(self):
+        g = _make_grid(5, 5)
+        c = g.copy()
+        c.set(Vector2(1, 1), Material.WALL)
+        assert g.get_xy(1, 1) is Material.FLOOR
+        assert c.get_xy(1, 1) is Material.WALL
+
 
 # =========================================================================
 # CombatAction validation with ranged weapons
@@ -429,6 +516,14 @@ class TestRangedMobVariants:
         cls = RACE_CLASS_MAP.get(("undead", EnemyTier.SCOUT))
         assert cls == HeroClass.CASTER
 
+    def test_gear_slot_tuples_mirror_tables(self):
+        slots = ("weapon", "armor", "accessory")
+        for tier, gear in TIER_STARTING_GEAR.items():
+            assert TIER_GEAR_SLOTS[tier] == tuple(gear[s] for s in slots)
+        for race, tier_gear in RACE_STARTING_GEAR.items():
+            for tier, gear in tier_gear.items():
+                assert RACE_GEAR_SLOTS[race][tier] == tuple(gear[s] for s in slots)
+
     def test_all_race_gear_weapons_exist(self):
         """All weapons in RACE_STARTING_GEAR must exist in ITEM_REGISTRY."""
         for race, tier_gear in RACE_STARTING_GEAR.items():